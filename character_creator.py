@@ -5,9 +5,51 @@ This module provides a character creator minigame that allows players
 to customize their own character with colors and visual features.
 """
 
+import asyncio
+import itertools
 import pygame
 import random
-from characters import Character
+from characters import Character, to_display_format
+from fonts import get_font
+
+# Input event types that are worth handling before yielding control
+_INPUT_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN)
+# Event types the creator loop reads
+_HANDLED_EVENTS = (pygame.QUIT,) + _INPUT_EVENTS
+# High-frequency event types the creator never reads; blocked while it runs
+# so SDL doesn't queue them (each one crosses the JS/WASM boundary in the browser)
+_NOISE_EVENTS = (
+    pygame.ACTIVEEVENT, pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.CONTROLLERAXISMOTION, pygame.FINGERMOTION, pygame.MOUSEWHEEL,
+    pygame.TEXTEDITING, pygame.TEXTINPUT,
+)
+
+
+def _preview_geometry(size):
+    """
+    Compute the fixed body, eye and pupil regions of a square preview sprite.
+
+    Args:
+        size: Preview width and height in pixels
+
+    Returns:
+        Tuple of (body rect, eye rects, pupil rects) as plain tuples
+    """
+    body_size = int(size * 0.8)  # Body is 80% of the sprite
+    offset = (size - body_size) // 2
+    eye_width = body_size // 4
+    eye_height = body_size // 6
+    eye_y = size // 2 - eye_height // 2
+    pupil_size = eye_width // 3
+    eye_rects = []
+    pupil_rects = []
+    for eye_center_x in (size // 3, 2 * size // 3):  # Left, right
+        eye_x = eye_center_x - eye_width // 2
+        eye_rects.append((eye_x, eye_y, eye_width, eye_height))
+        pupil_rects.append((eye_x + eye_width // 2 - pupil_size // 2,
+                            eye_y + eye_height // 2 - pupil_size // 2,
+                            pupil_size, pupil_size))
+    return (offset, offset, body_size, body_size), tuple(eye_rects), tuple(pupil_rects)
 
 
 class CharacterCreator:
@@ -43,6 +85,27 @@ class CharacterCreator:
     # Random name parts for character generation
     NAME_PREFIXES = ["Shadow", "Thunder", "Storm", "Fire", "Ice", "Wind", "Star", "Moon", "Sun", "Dragon"]
     NAME_SUFFIXES = ["blade", "walker", "runner", "striker", "dancer", "seeker", "rider", "slayer", "knight", "mage"]
+    # Every prefix+suffix combination, built once so a name is a single random.choice
+    _NAMES = tuple(prefix + suffix for prefix, suffix in itertools.product(NAME_PREFIXES, NAME_SUFFIXES))
+
+    # RGB slider labels and fill colors, in channel order
+    _SLIDER_NAMES = ("Red", "Green", "Blue")
+    _SLIDER_COLORS = ((255, 0, 0), (0, 255, 0), (0, 0, 255))
+
+    # Key dispatch tables for handle_event
+    _PRESET_KEYS = {pygame.K_1: "Knight", pygame.K_2: "Mage", pygame.K_3: "Ranger", pygame.K_4: "Custom"}
+    _SLIDER_SELECT_KEYS = {pygame.K_UP: -1, pygame.K_DOWN: 1}
+    _SLIDER_STEP_KEYS = {pygame.K_LEFT: -5, pygame.K_RIGHT: 5}
+
+    # Layout positions
+    PREVIEW_POS = (50, 80)
+    PREVIEW_SIZE = 128
+    _PREVIEW_BACKGROUND = (40, 40, 60)  # Dark background around the body
+    # Preview geometry is fixed, so it is computed once for the class
+    _PREVIEW_BODY_RECT, _PREVIEW_EYE_RECTS, _PREVIEW_PUPIL_RECTS = _preview_geometry(PREVIEW_SIZE)
+    SLIDER_X = 400
+    SLIDER_Y = 80
+    RGB_SLIDER_Y = SLIDER_Y + 180
 
     def __init__(self, screen):
         """
@@ -52,23 +115,40 @@ class CharacterCreator:
             screen: Pygame display surface
         """
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(36)
+        self.small_font = get_font(24)
 
         # Character attributes
         # Generate a random name
-        self.name = f"{random.choice(self.NAME_PREFIXES)}{random.choice(self.NAME_SUFFIXES)}"
+        self.name = random.choice(self._NAMES)
         self.body_color = list(self.PRESETS["Custom"])  # Start with gray
+        self._active_preset_index = list(self.PRESETS).index("Custom")  # Preset matching body_color, or -1
         self.eye_color = self.EYE_COLORS[0][1]  # Start with blue eyes
         self.selected_eye_color_index = 0
 
         # UI state
         self.active_slider = 0  # 0=Red, 1=Green, 2=Blue
-        self.slider_rects = []  # Store slider bar rectangles for mouse interaction
+        # Slider track geometry is fixed, so build it once (also used for mouse interaction)
+        self._track_rects = [pygame.Rect(self.SLIDER_X + 70, self.RGB_SLIDER_Y + 30 + i * 40 + 5, 200, 20)
+                             for i in range(3)]
+        self.slider_rects = list(self._track_rects)
         self.dragging_slider = None  # Track which slider is being dragged (None or 0-2)
 
         # Preview sprite
+        # Pre-render every preset/eye color combination so preset and eye
+        # changes are a dict lookup; only free RGB slider edits redraw.
         self.preview_sprite = None
+        # Reused for slider edits that miss the cache instead of allocating per update
+        self._preview_scratch = to_display_format(pygame.Surface((self.PREVIEW_SIZE, self.PREVIEW_SIZE)))
+        self._preview_scratch.fill(self._PREVIEW_BACKGROUND)
+        self._preview_dirty = False  # Set by input, consumed once per frame in draw()
+        # Screen regions needing a repaint; the first frame paints everything
+        self._dirty_rects = [pygame.Rect(0, 0, screen.get_width(), screen.get_height())]
+        self._preview_cache = {}
+        for preset_color in self.PRESETS.values():
+            for _, eye_color in self.EYE_COLORS:
+                self._preview_cache[(preset_color, eye_color)] = to_display_format(
+                    self._render_preview(preset_color, eye_color))
         self.update_preview()
 
         # Back button
@@ -95,49 +175,172 @@ class CharacterCreator:
         )
         self.create_button_hovered = False
 
+        # Regions that change with state, repainted independently by draw()
+        preview_x, preview_y = self.PREVIEW_POS
+        self._preview_area = pygame.Rect(preview_x, preview_y, self.PREVIEW_SIZE, self.PREVIEW_SIZE)
+        self._presets_area = pygame.Rect(self.SLIDER_X, self.SLIDER_Y + 30, 150, len(self.PRESETS) * 35)
+        self._sliders_area = pygame.Rect(self.SLIDER_X, self.RGB_SLIDER_Y + 30, 330, 120)
+        self._eye_area = pygame.Rect(self.SLIDER_X, self.RGB_SLIDER_Y + 150 + 30, 250, 40)
+
+        # Pre-render text that never changes so draw() only blits it
+        white = (255, 255, 255)
+        render = self.small_font.render
+        self._text = {
+            "title": self.font.render("Character Creator", True, white),
+            "back": to_display_format(render("Back", True, white), alpha=True),
+            "create": to_display_format(self.font.render("Create Character", True, white), alpha=True),
+            "name": render(f"Name: {self.name}", True, white),
+            "presets": render("Presets (1-4):", True, white),
+            "body_color": render("Body Color (Click/drag or arrow keys):", True, white),
+            "eye_color": render("Eye Color (E to cycle):", True, white),
+        }
+        self._preset_text = [render(f"{i+1}. {preset_name}", True, white)
+                             for i, preset_name in enumerate(self.PRESETS)]
+        # (inactive, active) label pair per RGB slider
+        # Slider labels: gray ones live in the background; the active row is
+        # covered by a yellow label pre-composited onto the background color
+        self._labels_gray = []
+        self._labels_yellow = []
+        for slider_name in self._SLIDER_NAMES:
+            self._labels_gray.append(render(f"{slider_name}:", True, (200, 200, 200)))
+            yellow_text = render(f"{slider_name}:", True, (255, 255, 100))
+            yellow_label = pygame.Surface(yellow_text.get_size())
+            yellow_label.fill((20, 20, 40))
+            yellow_label.blit(yellow_text, (0, 0))
+            self._labels_yellow.append(to_display_format(yellow_label))
+        self._label_pos = [(self.SLIDER_X, self.RGB_SLIDER_Y + 30 + i * 40) for i in range(3)]
+        self._eye_name_text = [to_display_format(render(eye_name, True, white), alpha=True)
+                               for eye_name, _ in self.EYE_COLORS]
+        self._instruction_text = [
+            render(instruction, True, (180, 180, 180)) for instruction in (
+                "Click/drag sliders or arrow keys | 1-4: Presets | E: Eye color",
+                "ESC or Back button: Cancel"
+            )
+        ]
+        # Slider value text, rendered on first use; values are 0-255 so the
+        # cache is naturally bounded
+        self._value_text_cache = {}
+
+        # Preset buttons and eye swatches are baked per state so draw()
+        # can emit them in a single fblits batch
+        self._preset_btn_pos = [(self.SLIDER_X, self.SLIDER_Y + 30 + i * 35)
+                                for i in range(len(self.PRESETS))]
+        self._preset_btn_inactive = [self._render_preset_button(i, False)
+                                     for i in range(len(self.PRESETS))]
+        self._preset_btn_active = [to_display_format(self._render_preset_button(i, True))
+                                   for i in range(len(self.PRESETS))]
+        self._eye_swatches = [to_display_format(self._render_eye_swatch(eye_color))
+                              for _, eye_color in self.EYE_COLORS]
+        # Full-width slider fills; draw() blits only the filled portion
+        self._fill_surfaces = []
+        for fill_color in self._SLIDER_COLORS:
+            fill_surface = pygame.Surface((200, 20))
+            fill_surface.fill(fill_color)
+            self._fill_surfaces.append(to_display_format(fill_surface))
+        self._eye_swatch_pos = (self.SLIDER_X, self.RGB_SLIDER_Y + 150 + 30)
+
+        self._background = to_display_format(self._build_background())
+
+    def reset(self):
+        """
+        Start a new character while keeping every pre-rendered asset.
+
+        Used when the creator is reopened: picks a new name, restores the
+        default colors and UI state, and schedules a full repaint.
+        """
+        self.name = random.choice(self._NAMES)
+        self._text["name"] = self.small_font.render(f"Name: {self.name}", True, (255, 255, 255))
+        self.body_color = list(self.PRESETS["Custom"])
+        self._active_preset_index = list(self.PRESETS).index("Custom")
+        self.selected_eye_color_index = 0
+        self.eye_color = self.EYE_COLORS[0][1]
+        self.active_slider = 0
+        self.dragging_slider = None
+        self.back_button_hovered = False
+        self.create_button_hovered = False
+        self._preview_dirty = False
+        self.update_preview()
+        self._background = to_display_format(self._build_background())
+        self._dirty_rects = [pygame.Rect(0, 0, self.screen.get_width(), self.screen.get_height())]
+
+    async def run(self):
+        """
+        Run the character creator until a character is created or cancelled.
+
+        Returns:
+            Character object if created successfully,
+            None if cancelled
+        """
+        print("=== Entering character creator ===")
+        clock = pygame.time.Clock()
+
+        running = True
+        result = None
+
+        pygame.event.set_blocked(_NOISE_EVENTS)
+        try:
+            while running:
+                events = pygame.event.get(_HANDLED_EVENTS)
+                # Drop the types the creator doesn't handle (KEYUP, touch, window
+                # events...) so they don't pile up for the selection screen; the
+                # queue isn't pumped again, so no newly arrived input is lost
+                pygame.event.clear(pump=False)
+                for event in _coalesce_mouse_motion(events):
+                    if event.type == pygame.QUIT:
+                        return None
+
+                    result = self.handle_event(event)
+                    if result is not None:  # Character created or cancelled
+                        running = False
+                        break
+
+                if running:
+                    # Only repaint and push the regions input changed
+                    if self._dirty_rects:
+                        pygame.display.update(self.draw())
+                    clock.tick(30)  # A static form; 30 FPS halves idle frame work
+                    # Yield to the browser only when no input is waiting; a pending
+                    # event is handled on the next pass without a round trip
+                    if not pygame.event.peek(_INPUT_EVENTS):
+                        await asyncio.sleep(0)  # Allow other async tasks to run
+        finally:
+            pygame.event.set_allowed(_NOISE_EVENTS)
+
+        return result if result is not False else None
+
     def update_preview(self):
         """Update the preview sprite with current customization."""
-        # Create a temporary character to generate sprite
-        temp_char = Character(
-            self.name if self.name else "Preview",
-            tuple(self.body_color),
-            "Custom character"
-        )
-        # Create larger sprite for preview (128x128)
-        size = 128
-        sprite = pygame.Surface((size, size))
-        sprite.fill((40, 40, 60))  # Dark background
-
-        # Draw character body (80% of size)
-        body_size = int(size * 0.8)
-        body_rect = pygame.Rect((size - body_size) // 2, (size - body_size) // 2,
-                                body_size, body_size)
-        pygame.draw.rect(sprite, tuple(self.body_color), body_rect)
-
-        # Draw eyes with selected eye color
-        eye_width = body_size // 4
-        eye_height = body_size // 6
-        eye_y = size // 2 - eye_height // 2
-
-        # Left eye
-        left_eye_rect = pygame.Rect(size // 3 - eye_width // 2, eye_y, eye_width, eye_height)
-        pygame.draw.rect(sprite, (255, 255, 255), left_eye_rect)
-        pupil_size = eye_width // 3
-        pygame.draw.rect(sprite, self.eye_color,
-                        (left_eye_rect.centerx - pupil_size // 2,
-                         left_eye_rect.centery - pupil_size // 2,
-                         pupil_size, pupil_size))
-
-        # Right eye
-        right_eye_rect = pygame.Rect(2 * size // 3 - eye_width // 2, eye_y, eye_width, eye_height)
-        pygame.draw.rect(sprite, (255, 255, 255), right_eye_rect)
-        pygame.draw.rect(sprite, self.eye_color,
-                        (right_eye_rect.centerx - pupil_size // 2,
-                         right_eye_rect.centery - pupil_size // 2,
-                         pupil_size, pupil_size))
-
+        key = (tuple(self.body_color), self.eye_color)
+        sprite = self._preview_cache.get(key)
+        if sprite is None:
+            sprite = self._render_preview(*key, sprite=self._preview_scratch)
         self.preview_sprite = sprite
 
+    def _render_preview(self, body_color, eye_color, sprite=None):
+        """
+        Render a preview sprite for the given colors.
+
+        Args:
+            body_color: Body color (RGB tuple)
+            eye_color: Pupil color (RGB tuple)
+            sprite: Optional 128x128 Surface to draw into instead of allocating
+                one; it must already carry the preview background
+
+        Returns:
+            128x128 pygame Surface
+        """
+        if sprite is None:
+            sprite = pygame.Surface((self.PREVIEW_SIZE, self.PREVIEW_SIZE))
+            sprite.fill(self._PREVIEW_BACKGROUND)
+        # The background margin never changes, so redrawing a reused sprite
+        # only touches the body and the eyes on top of it
+        sprite.fill(body_color, self._PREVIEW_BODY_RECT)
+        for eye_rect in self._PREVIEW_EYE_RECTS:
+            sprite.fill((255, 255, 255), eye_rect)
+        for pupil_rect in self._PREVIEW_PUPIL_RECTS:
+            sprite.fill(eye_color, pupil_rect)
+        return sprite
+
     def handle_event(self, event):
         """
         Handle input events for the character creator.
@@ -159,44 +362,43 @@ class CharacterCreator:
                 return self.create_character()
 
             # Arrow keys for color adjustment
-            elif event.key == pygame.K_UP:
-                self.active_slider = (self.active_slider - 1) % 3
-            elif event.key == pygame.K_DOWN:
-                self.active_slider = (self.active_slider + 1) % 3
-            elif event.key == pygame.K_LEFT:
-                self.body_color[self.active_slider] = max(0, self.body_color[self.active_slider] - 5)
-                self.update_preview()
-            elif event.key == pygame.K_RIGHT:
-                self.body_color[self.active_slider] = min(255, self.body_color[self.active_slider] + 5)
-                self.update_preview()
-
-            # Number keys 1-4 for preset selection
-            elif event.key == pygame.K_1:
-                self.body_color = list(self.PRESETS["Knight"])
-                self.update_preview()
-            elif event.key == pygame.K_2:
-                self.body_color = list(self.PRESETS["Mage"])
-                self.update_preview()
-            elif event.key == pygame.K_3:
-                self.body_color = list(self.PRESETS["Ranger"])
-                self.update_preview()
-            elif event.key == pygame.K_4:
-                self.body_color = list(self.PRESETS["Custom"])
-                self.update_preview()
+            elif event.key in self._SLIDER_SELECT_KEYS:
+                self.active_slider = (self.active_slider + self._SLIDER_SELECT_KEYS[event.key]) % 3
+                self._mark_dirty(self._sliders_area)
+            elif event.key in self._SLIDER_STEP_KEYS:
+                body_color = self.body_color
+                slider = self.active_slider
+                current = body_color[slider]
+                value = max(0, min(255, current + self._SLIDER_STEP_KEYS[event.key]))
+                if value != current:  # Already at the end of the range
+                    body_color[slider] = value
+                    self._body_color_changed()
+
+            # Number keys 1-4 for preset selection (no-op if already applied)
+            elif event.key in self._PRESET_KEYS:
+                self._apply_preset(self._PRESET_KEYS[event.key])
 
             # E key to cycle through eye colors
-            elif event.key == pygame.K_e:
+            elif event.key == pygame.K_e and len(self.EYE_COLORS) > 1:
                 self.selected_eye_color_index = (self.selected_eye_color_index + 1) % len(self.EYE_COLORS)
                 self.eye_color = self.EYE_COLORS[self.selected_eye_color_index][1]
-                self.update_preview()
+                self._preview_dirty = True
+                self._mark_dirty(self._preview_area, self._eye_area)
 
         # Handle mouse motion for hover detection and dragging
         elif event.type == pygame.MOUSEMOTION:
             mouse_pos = event.pos
 
-            # Check if mouse is hovering over buttons
-            self.back_button_hovered = self.back_button_rect.collidepoint(mouse_pos)
-            self.create_button_hovered = self.create_button_rect.collidepoint(mouse_pos)
+            # Check if mouse is hovering over buttons; only a hover
+            # transition needs a repaint
+            back_hovered = self.back_button_rect.collidepoint(mouse_pos)
+            if back_hovered != self.back_button_hovered:
+                self.back_button_hovered = back_hovered
+                self._mark_dirty(self.back_button_rect)
+            create_hovered = self.create_button_rect.collidepoint(mouse_pos)
+            if create_hovered != self.create_button_hovered:
+                self.create_button_hovered = create_hovered
+                self._mark_dirty(self.create_button_rect)
 
             # Handle slider dragging
             if self.dragging_slider is not None:
@@ -207,7 +409,7 @@ class CharacterCreator:
                 value = int((relative_x / slider_rect.width) * 255)
                 self.body_color[self.dragging_slider] = value
                 self.active_slider = self.dragging_slider
-                self.update_preview()
+                self._body_color_changed()
 
         # Handle mouse clicks
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -232,7 +434,7 @@ class CharacterCreator:
                         relative_x = max(0, min(relative_x, slider_rect.width))
                         value = int((relative_x / slider_rect.width) * 255)
                         self.body_color[i] = value
-                        self.update_preview()
+                        self._body_color_changed()
                         break
 
         # Handle mouse button release to stop dragging
@@ -242,6 +444,40 @@ class CharacterCreator:
 
         return None
 
+    def _apply_preset(self, preset_name):
+        """
+        Switch the body color to a preset, skipping the work if it is already set.
+
+        Args:
+            preset_name: Key into PRESETS
+        """
+        if tuple(self.body_color) != self.PRESETS[preset_name]:
+            self.body_color = list(self.PRESETS[preset_name])
+            self._body_color_changed()
+
+    def _body_color_changed(self):
+        """Flag the preview and every region showing the body color for repaint."""
+        self._preview_dirty = True
+        # Resolve the highlighted preset once per change rather than every frame
+        self._active_preset_index = -1
+        body_color = tuple(self.body_color)
+        for i, preset_color in enumerate(self.PRESETS.values()):
+            if preset_color == body_color:
+                self._active_preset_index = i
+                break
+        self._mark_dirty(self._preview_area, self._presets_area, self._sliders_area)
+
+    def _mark_dirty(self, *rects):
+        """
+        Queue screen regions for repaint on the next draw().
+
+        Args:
+            *rects: Regions whose content changed
+        """
+        for rect in rects:
+            if rect not in self._dirty_rects:
+                self._dirty_rects.append(rect)
+
     def create_character(self):
         """
         Create and return a Character object with current customization.
@@ -256,133 +492,223 @@ class CharacterCreator:
             eye_color=self.eye_color
         )
 
+    def _build_background(self):
+        """
+        Render everything that never changes into a single Surface.
+
+        Returns:
+            Screen-sized pygame Surface with the static creator chrome
+        """
+        width, height = self.screen.get_width(), self.screen.get_height()
+        background = pygame.Surface((width, height))
+
+        # Dark background
+        background.fill((20, 20, 40))
+
+        # Title
+        title = self._text["title"]
+        background.blit(title, (width // 2 - title.get_width() // 2, 20))
+
+        # Border around preview
+        preview_x, preview_y = self.PREVIEW_POS
+        pygame.draw.rect(background, (255, 255, 255),
+                         (preview_x - 2, preview_y - 2, 132, 132), 2)
+
+        # Character name below preview
+        background.blit(self._text["name"], (50, 220))
+
+        # Preset buttons (inactive state; the active one is overlaid per frame)
+        slider_x, slider_y = self.SLIDER_X, self.SLIDER_Y
+        background.blit(self._text["presets"], (slider_x, slider_y))
+        background.blits(list(zip(self._preset_btn_inactive, self._preset_btn_pos)), False)
+
+        # RGB slider tracks
+        rgb_slider_y = self.RGB_SLIDER_Y
+        background.blit(self._text["body_color"], (slider_x, rgb_slider_y))
+        background.blits(list(zip(self._labels_gray, self._label_pos)), False)
+        for slider_rect in self._track_rects:
+            pygame.draw.rect(background, (60, 60, 80), slider_rect)
+            pygame.draw.rect(background, (255, 255, 255), slider_rect, 2)
+
+        # Eye color label
+        eye_y = rgb_slider_y + 150
+        background.blit(self._text["eye_color"], (slider_x, eye_y))
+
+        # Instructions at bottom
+        inst_y = height - 80
+        for i, inst_text in enumerate(self._instruction_text):
+            background.blit(inst_text, (50, inst_y + i * 25))
+
+        return background
+
+    def _render_preset_button(self, index, is_active):
+        """
+        Render a preset button with its color sample and label baked in.
+
+        Args:
+            index: Preset index (0-3)
+            is_active: Whether to render the highlighted state
+
+        Returns:
+            150x30 pygame Surface
+        """
+        preset_color = list(self.PRESETS.values())[index]
+        button = pygame.Surface((150, 30))
+
+        btn_color = (100, 150, 255) if is_active else (60, 60, 80)
+        button.fill(btn_color)
+        pygame.draw.rect(button, (255, 255, 255), (0, 0, 150, 30), 2)
+
+        # Preset color sample
+        pygame.draw.rect(button, preset_color, (5, 5, 20, 20))
+
+        # Preset name
+        button.blit(self._preset_text[index], (30, 5))
+        return button
+
+    def _render_eye_swatch(self, eye_color):
+        """
+        Render the framed eye color swatch.
+
+        Args:
+            eye_color: Pupil color (RGB tuple)
+
+        Returns:
+            40x40 pygame Surface
+        """
+        swatch = pygame.Surface((40, 40))
+        swatch.fill(eye_color)
+        pygame.draw.rect(swatch, (255, 255, 255), (0, 0, 40, 40), 2)
+        return swatch
+
+    def _render_value(self, value):
+        """
+        Get the text Surface for a slider value, rendering it on first use.
+
+        Args:
+            value: Slider value (0-255)
+
+        Returns:
+            pygame Surface with the value text
+        """
+        value_text = self._value_text_cache.get(value)
+        if value_text is None:
+            value_text = to_display_format(self.small_font.render(str(value), True, (255, 255, 255)), alpha=True)
+            self._value_text_cache[value] = value_text
+        return value_text
+
     def draw(self):
-        """Draw the character creator interface."""
-        # Clear screen with dark background
-        self.screen.fill((20, 20, 40))
+        """
+        Repaint the regions that changed since the last draw.
+
+        Each dirty region is repainted with the screen clipped to it, so
+        blits outside it cost nothing.
+
+        Returns:
+            List of repainted Rects, for pygame.display.update
+        """
+        # Regenerate the preview at most once per frame, however many
+        # input events changed it since the last draw
+        if self._preview_dirty:
+            self.update_preview()
+            self._preview_dirty = False
+
+        dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        for rect in dirty_rects:
+            self.screen.set_clip(rect)
+            self._paint()
+        self.screen.set_clip(None)
+        return dirty_rects
+
+    def _paint(self):
+        """Draw the whole interface, limited to the screen's current clip."""
+        # Bind hot attribute chains to locals once per frame
+        screen = self.screen
+        blit = screen.blit
+        draw_rect = pygame.draw.rect
+        body_color = self.body_color
+
+        # Static chrome (title, labels, tracks, instructions) in one blit
+        blit(self._background, (0, 0))
 
         # Draw back button (top right)
+        back_button_rect = self.back_button_rect
         button_color = (100, 100, 200) if self.back_button_hovered else (70, 70, 150)
-        pygame.draw.rect(self.screen, button_color, self.back_button_rect, border_radius=5)
-        pygame.draw.rect(self.screen, (200, 200, 255), self.back_button_rect, 2, border_radius=5)
+        draw_rect(screen, button_color, back_button_rect, border_radius=5)
+        draw_rect(screen, (200, 200, 255), back_button_rect, 2, border_radius=5)
 
-        back_text = self.small_font.render("Back", True, (255, 255, 255))
-        back_text_rect = back_text.get_rect(center=self.back_button_rect.center)
-        self.screen.blit(back_text, back_text_rect)
-
-        # Title
-        title = self.font.render("Character Creator", True, (255, 255, 255))
-        self.screen.blit(title, (self.screen.get_width() // 2 - title.get_width() // 2, 20))
+        back_text = self._text["back"]
+        blit(back_text, back_text.get_rect(center=back_button_rect.center))
 
         # Draw preview sprite
-        preview_x = 50
-        preview_y = 80
         if self.preview_sprite:
-            self.screen.blit(self.preview_sprite, (preview_x, preview_y))
-            # Draw border around preview
-            pygame.draw.rect(self.screen, (255, 255, 255),
-                           (preview_x - 2, preview_y - 2, 132, 132), 2)
-
-        # Display character name below preview
-        name_y = 220
-        name_label = self.small_font.render(f"Name: {self.name}", True, (255, 255, 255))
-        self.screen.blit(name_label, (50, name_y))
-
-        # Color sliders section
-        slider_x = 400
-        slider_y = 80
-
-        # Preset buttons
-        presets_label = self.small_font.render("Presets (1-4):", True, (255, 255, 255))
-        self.screen.blit(presets_label, (slider_x, slider_y))
-
-        preset_names = ["Knight", "Mage", "Ranger", "Custom"]
-        for i, preset_name in enumerate(preset_names):
-            btn_y = slider_y + 30 + i * 35
-            btn_rect = pygame.Rect(slider_x, btn_y, 150, 30)
-
-            # Highlight if current color matches preset
-            is_active = list(self.PRESETS[preset_name]) == self.body_color
-            btn_color = (100, 150, 255) if is_active else (60, 60, 80)
-            pygame.draw.rect(self.screen, btn_color, btn_rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), btn_rect, 2)
-
-            # Draw preset color sample
-            color_sample_rect = pygame.Rect(slider_x + 5, btn_y + 5, 20, 20)
-            pygame.draw.rect(self.screen, self.PRESETS[preset_name], color_sample_rect)
-
-            # Draw preset name
-            preset_text = self.small_font.render(f"{i+1}. {preset_name}", True, (255, 255, 255))
-            self.screen.blit(preset_text, (slider_x + 30, btn_y + 5))
-
-        # RGB Sliders
-        rgb_slider_y = slider_y + 180
-        rgb_label = self.small_font.render("Body Color (Click/drag or arrow keys):", True, (255, 255, 255))
-        self.screen.blit(rgb_label, (slider_x, rgb_slider_y))
-
-        # Clear and rebuild slider rects for mouse interaction
-        self.slider_rects = []
-
-        slider_names = ["Red", "Green", "Blue"]
-        for i, slider_name in enumerate(slider_names):
-            s_y = rgb_slider_y + 30 + i * 40
-
-            # Label
-            is_active_slider = (i == self.active_slider)
-            label_color = (255, 255, 100) if is_active_slider else (200, 200, 200)
-            label = self.small_font.render(f"{slider_name}:", True, label_color)
-            self.screen.blit(label, (slider_x, s_y))
-
-            # Slider bar
-            slider_rect = pygame.Rect(slider_x + 70, s_y + 5, 200, 20)
-            self.slider_rects.append(slider_rect)  # Store for mouse interaction
-            pygame.draw.rect(self.screen, (60, 60, 80), slider_rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), slider_rect, 2)
-
-            # Slider fill
-            fill_width = int((self.body_color[i] / 255) * 200)
-            fill_rect = pygame.Rect(slider_x + 70, s_y + 5, fill_width, 20)
-            slider_color = [0, 0, 0]
-            slider_color[i] = 255
-            pygame.draw.rect(self.screen, tuple(slider_color), fill_rect)
+            blit(self.preview_sprite, self.PREVIEW_POS)
+
+        # Highlighted preset (if the current color matches one) and eye
+        # swatch go out as one batch
+        batch = []
+        active_preset = self._active_preset_index
+        if active_preset >= 0:
+            batch.append((self._preset_btn_active[active_preset], self._preset_btn_pos[active_preset]))
+        batch.append((self._eye_swatches[self.selected_eye_color_index], self._eye_swatch_pos))
+        screen.fblits(batch)
+
+        slider_x = self.SLIDER_X
+
+        # RGB slider fills, labels and values
+        rgb_slider_y = self.RGB_SLIDER_Y
+        active_slider = self.active_slider
+        blit(self._labels_yellow[active_slider], self._label_pos[active_slider])
+        fill_surfaces = self._fill_surfaces
+        track_rects = self._track_rects
+        render_value = self._render_value
+        for i in range(3):
+            value = body_color[i]
+
+            # Slider fill (track itself is drawn in the background)
+            blit(fill_surfaces[i], track_rects[i].topleft, (0, 0, value * 200 // 255, 20))
 
             # Value text
-            value_text = self.small_font.render(str(self.body_color[i]), True, (255, 255, 255))
-            self.screen.blit(value_text, (slider_x + 280, s_y))
+            blit(render_value(value), (slider_x + 280, rgb_slider_y + 30 + i * 40))
 
-        # Eye color section
+        # Current eye color name
         eye_y = rgb_slider_y + 150
-        eye_label = self.small_font.render("Eye Color (E to cycle):", True, (255, 255, 255))
-        self.screen.blit(eye_label, (slider_x, eye_y))
-
-        # Current eye color display
-        current_eye_name = self.EYE_COLORS[self.selected_eye_color_index][0]
-        eye_color_rect = pygame.Rect(slider_x, eye_y + 30, 40, 40)
-        pygame.draw.rect(self.screen, self.eye_color, eye_color_rect)
-        pygame.draw.rect(self.screen, (255, 255, 255), eye_color_rect, 2)
-
-        eye_name_text = self.small_font.render(current_eye_name, True, (255, 255, 255))
-        self.screen.blit(eye_name_text, (slider_x + 50, eye_y + 40))
+        blit(self._eye_name_text[self.selected_eye_color_index], (slider_x + 50, eye_y + 40))
 
         # Draw Create Character button (center bottom, above instructions)
+        create_button_rect = self.create_button_rect
         create_button_color = (100, 200, 100) if self.create_button_hovered else (50, 150, 50)
-        pygame.draw.rect(self.screen, create_button_color, self.create_button_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (150, 255, 150), self.create_button_rect, 3, border_radius=8)
+        draw_rect(screen, create_button_color, create_button_rect, border_radius=8)
+        draw_rect(screen, (150, 255, 150), create_button_rect, 3, border_radius=8)
 
-        create_text = self.font.render("Create Character", True, (255, 255, 255))
-        create_text_rect = create_text.get_rect(center=self.create_button_rect.center)
-        self.screen.blit(create_text, create_text_rect)
+        create_text = self._text["create"]
+        blit(create_text, create_text.get_rect(center=create_button_rect.center))
 
-        # Instructions at bottom
-        instructions = [
-            "Click/drag sliders or arrow keys | 1-4: Presets | E: Eye color",
-            "ESC or Back button: Cancel"
-        ]
 
-        inst_y = self.screen.get_height() - 80
-        for i, instruction in enumerate(instructions):
-            inst_text = self.small_font.render(instruction, True, (180, 180, 180))
-            self.screen.blit(inst_text, (50, inst_y + i * 25))
+def _coalesce_mouse_motion(events):
+    """
+    Collapse each run of consecutive MOUSEMOTION events into its last event.
+
+    Only the final pointer position matters for the next frame, so intermediate
+    motion samples are dropped. Runs are collapsed in place, keeping motion
+    ordered relative to button events (a drag's last motion still lands
+    before the MOUSEBUTTONUP that ends it).
+
+    Args:
+        events: List of pygame events
+
+    Returns:
+        List of events with redundant motion removed
+    """
+    coalesced = []
+    for event in events:
+        if (event.type == pygame.MOUSEMOTION and coalesced
+                and coalesced[-1].type == pygame.MOUSEMOTION):
+            coalesced[-1] = event
+        else:
+            coalesced.append(event)
+    return coalesced
 
 
 async def run_character_creator(screen):
@@ -396,29 +722,4 @@ async def run_character_creator(screen):
         Character object if created successfully,
         None if cancelled
     """
-    import asyncio
-
-    print("=== Entering character creator ===")
-    creator = CharacterCreator(screen)
-    clock = pygame.time.Clock()
-
-    running = True
-    result = None
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return None
-
-            result = creator.handle_event(event)
-            if result is not None:  # Character created or cancelled
-                running = False
-                break
-
-        if running:
-            creator.draw()
-            pygame.display.flip()
-            clock.tick(60)
-            await asyncio.sleep(0)  # Allow other async tasks to run
-
-    return result if result is not False else None
+    return await CharacterCreator(screen).run()
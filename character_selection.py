@@ -2,7 +2,8 @@
 Character selection screen for the game.
 """
 import pygame
-from characters import CHARACTERS
+from characters import CHARACTERS, to_display_format
+from fonts import get_font
 from version import __version__
 
 # Special index to indicate custom character creation
@@ -22,9 +23,22 @@ class CharacterSelectionScreen:
         self.screen = screen
         self.selected_index = 0
         self.total_options = len(CHARACTERS) + 1  # +1 for custom character option
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.character_rects = []  # Store clickable areas for mouse support
+        self.font = get_font(36)
+        self.small_font = get_font(24)
+        # Clickable layout for mouse support, set on first draw: options sit in
+        # equal-width columns, clickable within a horizontal band
+        self._col_width = None
+        self._click_band = None
+        # Cached (surface, rect) pairs and sprite rects, built on first draw
+        self._static_blits = None
+        self._sprite_rects = []
+        self._drawn_index = None  # Highlighted option on screen; None forces a full paint
+        self._last_mouse_pos = None  # Pointer position seen by update_hover()
+
+    def reset_selection(self):
+        """Select the first option again, for reopening the screen."""
+        self.selected_index = 0
+        self.invalidate()
 
     def handle_event(self, event):
         """
@@ -53,51 +67,105 @@ class CharacterSelectionScreen:
                 mouse_pos = event.pos
 
                 # Check if click is on any character
-                for i, rect in enumerate(self.character_rects):
-                    if rect.collidepoint(mouse_pos):
-                        # Single click selects, double click (or same click) confirms
-                        if self.selected_index == i:
-                            # Already selected, confirm selection
-                            if i == len(CHARACTERS):
-                                return CREATE_CUSTOM_INDEX
-                            return i
-                        else:
-                            # Select this character
-                            self.selected_index = i
-                        break
+                i = self._option_at(mouse_pos)
+                if i is not None:
+                    # Single click selects, double click (or same click) confirms
+                    if self.selected_index == i:
+                        # Already selected, confirm selection
+                        if i == len(CHARACTERS):
+                            return CREATE_CUSTOM_INDEX
+                        return i
+                    else:
+                        # Select this character
+                        self.selected_index = i
 
         elif event.type == pygame.MOUSEMOTION:
-            # Highlight character on hover
-            mouse_pos = event.pos
-            for i, rect in enumerate(self.character_rects):
-                if rect.collidepoint(mouse_pos):
-                    self.selected_index = i
-                    break
+            self._hover(event.pos)
 
         return None
 
-    def draw(self):
-        """Draw the character selection screen."""
-        self.screen.fill((20, 20, 40))  # Dark blue background
+    def update_hover(self, mouse_pos):
+        """
+        Apply hover from a polled pointer position, once per frame.
 
-        # Clear clickable areas
-        self.character_rects = []
+        Only pointer movement changes the selection, so a resting pointer
+        doesn't override keyboard choices. The first position after
+        invalidate() is only recorded.
 
-        # Draw title
-        title = self.font.render("Select Your Character", True, (255, 255, 255))
-        title_rect = title.get_rect(center=(self.screen.get_width() // 2, 50))
-        self.screen.blit(title, title_rect)
+        Args:
+            mouse_pos: Current (x, y) pointer position
+        """
+        last_pos = self._last_mouse_pos
+        self._last_mouse_pos = mouse_pos
+        if last_pos is not None and mouse_pos != last_pos:
+            self._hover(mouse_pos)
 
-        # Draw characters (now 4 options including custom)
-        char_width = self.screen.get_width() // 4
+    def _hover(self, mouse_pos):
+        """
+        Highlight the option under the pointer, if any.
 
-        # Draw preset characters
+        Args:
+            mouse_pos: (x, y) pointer position
+        """
+        i = self._option_at(mouse_pos)
+        if i is not None:
+            self.selected_index = i
+
+    def _option_at(self, pos):
+        """
+        Find the option under a screen position with column arithmetic.
+
+        Args:
+            pos: (x, y) screen position
+
+        Returns:
+            Option index, or None if the position is outside every option
+            (or the screen hasn't been drawn yet)
+        """
+        if self._col_width is None:
+            return None
+        x, y = pos
+        top, bottom = self._click_band
+        if top <= y < bottom:
+            col = x // self._col_width
+            if 0 <= col < self.total_options:
+                return col
+        return None
+
+    def _build_layout(self):
+        """
+        Render every sprite and text Surface once and lay them out.
+
+        Nothing on this screen changes between frames except the highlight,
+        so draw() only blits the cached Surfaces built here.
+        """
+        width, height = self.screen.get_width(), self.screen.get_height()
+        white = (255, 255, 255)
+        gray = (200, 200, 200)
+        self._static_blits = []
+        self._sprite_rects = []
+
+        def place(surface, **anchor):
+            self._static_blits.append((surface, surface.get_rect(**anchor)))
+
+        # Title
+        place(to_display_format(self.font.render("Select Your Character", True, white), alpha=True),
+              center=(width // 2, 50))
+
+        # Characters (4 options including custom)
+        char_width = width // 4
+        y_pos = height // 2
+        sprite_size = 64
+
+        # Clickable band covers the sprites plus the name/desc text below them
+        self._col_width = char_width
+        self._click_band = (y_pos - sprite_size // 2 - 80, y_pos + sprite_size // 2 + 80)
+
+        # Preset characters
         for i, character in enumerate(CHARACTERS):
             x_pos = char_width * i + char_width // 2
-            y_pos = self.screen.get_height() // 2
 
-            # Create and draw character sprite (larger for selection)
-            sprite_size = 64
+            # Character sprite (larger for selection)
             sprite = pygame.Surface((sprite_size, sprite_size))
             sprite.fill(character.color)
 
@@ -106,92 +174,119 @@ class CharacterSelectionScreen:
             pygame.draw.rect(sprite, (255, 255, 255), (36, 20, 12, 12))  # Right eye
             pygame.draw.rect(sprite, character.eye_color, (20, 24, 4, 4))  # Left pupil
             pygame.draw.rect(sprite, character.eye_color, (40, 24, 4, 4))  # Right pupil
+            self._add_option(to_display_format(sprite), x_pos, y_pos)
 
-            sprite_rect = sprite.get_rect(center=(x_pos, y_pos))
-
-            # Store clickable area (expanded for easier clicking)
-            clickable_rect = sprite_rect.inflate(40, 160)  # Expand to include name/desc
-            self.character_rects.append(clickable_rect)
-
-            # Highlight selected character
-            if i == self.selected_index:
-                pygame.draw.rect(self.screen, (255, 255, 0),
-                               sprite_rect.inflate(20, 20), 5)
+            # Character name
+            place(to_display_format(self.font.render(character.name, True, white), alpha=True),
+                  center=(x_pos, y_pos + 60))
 
-            self.screen.blit(sprite, sprite_rect)
-
-            # Draw character name
-            name_text = self.font.render(character.name, True, (255, 255, 255))
-            name_rect = name_text.get_rect(center=(x_pos, y_pos + 60))
-            self.screen.blit(name_text, name_rect)
-
-            # Draw character description
+            # Character description
             desc_words = character.description.split()
             line1 = " ".join(desc_words[:4])
             line2 = " ".join(desc_words[4:])
-
-            desc_text1 = self.small_font.render(line1, True, (200, 200, 200))
-            desc_rect1 = desc_text1.get_rect(center=(x_pos, y_pos + 90))
-            self.screen.blit(desc_text1, desc_rect1)
-
+            place(to_display_format(self.small_font.render(line1, True, gray), alpha=True),
+                  center=(x_pos, y_pos + 90))
             if line2:
-                desc_text2 = self.small_font.render(line2, True, (200, 200, 200))
-                desc_rect2 = desc_text2.get_rect(center=(x_pos, y_pos + 110))
-                self.screen.blit(desc_text2, desc_rect2)
+                place(to_display_format(self.small_font.render(line2, True, gray), alpha=True),
+                      center=(x_pos, y_pos + 110))
 
-        # Draw "Create Custom" option as 4th choice
-        custom_index = len(CHARACTERS)
-        x_pos = char_width * custom_index + char_width // 2
-        y_pos = self.screen.get_height() // 2
+        # "Create Custom" option as 4th choice
+        x_pos = char_width * len(CHARACTERS) + char_width // 2
 
-        # Create custom character placeholder sprite with + symbol
-        sprite_size = 64
+        # Custom character placeholder sprite with + symbol
         custom_sprite = pygame.Surface((sprite_size, sprite_size))
         custom_sprite.fill((100, 100, 100))
-
-        # Draw a + symbol
         plus_thickness = 8
         pygame.draw.rect(custom_sprite, (255, 255, 255),
                         (sprite_size // 2 - plus_thickness // 2, 12, plus_thickness, 40))
         pygame.draw.rect(custom_sprite, (255, 255, 255),
                         (12, sprite_size // 2 - plus_thickness // 2, 40, plus_thickness))
+        self._add_option(to_display_format(custom_sprite), x_pos, y_pos)
 
-        sprite_rect = custom_sprite.get_rect(center=(x_pos, y_pos))
+        place(to_display_format(self.font.render("Create", True, white), alpha=True),
+              center=(x_pos, y_pos + 60))
+        place(to_display_format(self.font.render("Custom", True, white), alpha=True),
+              center=(x_pos, y_pos + 85))
+        place(to_display_format(self.small_font.render("Design your own", True, gray), alpha=True),
+              center=(x_pos, y_pos + 115))
 
-        # Store clickable area for custom character option
-        clickable_rect = sprite_rect.inflate(40, 160)
-        self.character_rects.append(clickable_rect)
+        # Instructions
+        instructions = self.small_font.render(
+            "LEFT/RIGHT arrows or HOVER to select | ENTER/SPACE or CLICK to confirm",
+            True, (180, 180, 180)
+        )
+        place(to_display_format(instructions, alpha=True), center=(width // 2, height - 50))
 
-        # Highlight if selected
-        if self.selected_index == custom_index:
-            pygame.draw.rect(self.screen, (255, 255, 0),
-                           sprite_rect.inflate(20, 20), 5)
+        # Version number in bottom left corner
+        version_text = self.small_font.render(f"v{__version__}", True, (120, 120, 120))
+        place(to_display_format(version_text, alpha=True), topleft=(10, height - 30))
 
-        self.screen.blit(custom_sprite, sprite_rect)
+    def _add_option(self, sprite, x_pos, y_pos):
+        """
+        Place an option sprite and remember its rect for highlighting.
 
-        # Draw "Create Custom" text
-        name_text = self.font.render("Create", True, (255, 255, 255))
-        name_rect = name_text.get_rect(center=(x_pos, y_pos + 60))
-        self.screen.blit(name_text, name_rect)
+        Args:
+            sprite: Option sprite Surface
+            x_pos: Sprite center x
+            y_pos: Sprite center y
+        """
+        sprite_rect = sprite.get_rect(center=(x_pos, y_pos))
+        self._static_blits.append((sprite, sprite_rect))
+        self._sprite_rects.append(sprite_rect)
 
-        name_text2 = self.font.render("Custom", True, (255, 255, 255))
-        name_rect2 = name_text2.get_rect(center=(x_pos, y_pos + 85))
-        self.screen.blit(name_text2, name_rect2)
+    def draw(self):
+        """
+        Draw the character selection screen.
 
-        desc_text = self.small_font.render("Design your own", True, (200, 200, 200))
-        desc_rect = desc_text.get_rect(center=(x_pos, y_pos + 115))
-        self.screen.blit(desc_text, desc_rect)
+        The whole screen is painted on the first draw (and after invalidate());
+        afterwards only a change of selection repaints, limited to the old and
+        new highlight areas.
 
-        # Draw instructions
-        instructions = self.small_font.render(
-            "LEFT/RIGHT arrows or HOVER to select | ENTER/SPACE or CLICK to confirm",
-            True, (180, 180, 180)
-        )
-        instr_rect = instructions.get_rect(
-            center=(self.screen.get_width() // 2, self.screen.get_height() - 50)
-        )
-        self.screen.blit(instructions, instr_rect)
+        Returns:
+            List of repainted Rects, for pygame.display.update
+        """
+        if self._static_blits is None:
+            self._build_layout()
+
+        if self._drawn_index is None:
+            self._paint()
+            dirty_rects = [self.screen.get_rect()]
+        elif self._drawn_index != self.selected_index:
+            dirty_rects = [self._highlight_rect(index)
+                           for index in (self._drawn_index, self.selected_index)
+                           if 0 <= index < len(self._sprite_rects)]
+            for rect in dirty_rects:
+                self.screen.set_clip(rect)
+                self._paint()
+            self.screen.set_clip(None)
+        else:
+            dirty_rects = []
+
+        self._drawn_index = self.selected_index
+        return dirty_rects
+
+    def invalidate(self):
+        """Force the next draw() to repaint the whole screen and rebase hover tracking."""
+        self._drawn_index = None
+        self._last_mouse_pos = None
+
+    def _highlight_rect(self, index):
+        """
+        Get the area covered by an option's selection highlight.
 
-        # Draw version number in bottom left corner
-        version_text = self.small_font.render(f"v{__version__}", True, (120, 120, 120))
-        self.screen.blit(version_text, (10, self.screen.get_height() - 30))
+        Args:
+            index: Option index
+
+        Returns:
+            pygame.Rect around the option sprite
+        """
+        return self._sprite_rects[index].inflate(20, 20)
+
+    def _paint(self):
+        """Paint the screen, limited to its current clip."""
+        self.screen.fill((20, 20, 40))  # Dark blue background
+        self.screen.blits(self._static_blits, False)
+
+        # Highlight selected character
+        if 0 <= self.selected_index < len(self._sprite_rects):
+            pygame.draw.rect(self.screen, (255, 255, 0), self._highlight_rect(self.selected_index), 5)
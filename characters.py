@@ -3,6 +3,26 @@ Character definitions and sprite management for the game.
 """
 import pygame
 
+
+def to_display_format(surface, alpha=False):
+    """
+    Convert a Surface to the display's pixel format so blits take SDL's fast path.
+
+    Conversion needs a display mode, so the Surface is returned unchanged
+    when none has been set (e.g. in headless tests).
+
+    Args:
+        surface: Pygame Surface to convert
+        alpha: Keep per-pixel alpha (use for antialiased text)
+
+    Returns:
+        Converted Surface, or the original if there is no display
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
 class Character:
     """Represents a playable character in the game."""
 
@@ -36,7 +56,7 @@ class Character:
         pygame.draw.rect(sprite, self.eye_color, (10, 12, 2, 2))  # Left pupil
         pygame.draw.rect(sprite, self.eye_color, (20, 12, 2, 2))  # Right pupil
 
-        return sprite
+        return to_display_format(sprite)
 
     def move(self, dx, dy, screen_width, screen_height):
         """
@@ -0,0 +1,24 @@
+"""
+Shared font cache for the game's screens.
+"""
+import pygame
+
+# Fonts by point size; opening a font parses the font file, so each size is
+# created once per process and shared by every screen
+_fonts = {}
+
+
+def get_font(size):
+    """
+    Get the default font at the given size, creating it on first use.
+
+    Args:
+        size: Font size in points
+
+    Returns:
+        pygame.font.Font instance
+    """
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
@@ -3,12 +3,23 @@ Main game logic and gameplay screen.
 """
 import pygame
 import math
-from characters import get_character_by_index
+from characters import get_character_by_index, to_display_format
+from fonts import get_font
+
+# Movement keys (arrows and WASD), bound once so update() skips the
+# pygame attribute lookups every frame
+_K_UP, _K_W = pygame.K_UP, pygame.K_w
+_K_DOWN, _K_S = pygame.K_DOWN, pygame.K_s
+_K_LEFT, _K_A = pygame.K_LEFT, pygame.K_a
+_K_RIGHT, _K_D = pygame.K_RIGHT, pygame.K_d
 
 
 class Game:
     """Main game class handling gameplay logic."""
 
+    # Target marker lifetime: 60 frames (1 second at 60 FPS)
+    MARKER_FRAMES = 60
+
     def __init__(self, screen, character_index, custom_character=None):
         """
         Initialize the game.
@@ -19,32 +30,132 @@ class Game:
             custom_character: Optional custom Character object (overrides character_index)
         """
         self.screen = screen
+        # Screen size is fixed for the session; cached for per-frame use
+        self._width = screen.get_width()
+        self._height = screen.get_height()
         # Use custom character if provided, otherwise get by index
         if custom_character is not None:
             self.character = custom_character
         else:
             self.character = get_character_by_index(character_index)
         self.sprite = self.character.create_sprite()
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
         self.running = True
         self.return_to_selection = False  # Flag to return to character selection
 
         # Click-to-move state
         self.target_pos = None  # Target position for click-to-move
         self.target_marker_timer = 0  # Timer for target marker animation
+        self._marker_frames = None  # One pre-rendered marker per timer value, built on first use
 
         # Back button
         button_width = 100
         button_height = 40
         padding = 10
         self.back_button_rect = pygame.Rect(
-            screen.get_width() - button_width - padding,
+            self._width - button_width - padding,
             padding,
             button_width,
             button_height
         )
         self.back_button_hovered = False
 
+        self._background = self._build_background()
+        # Text and HUD surfaces never change during play; built on first draw
+        self._back_text = None
+        self._hud_text = None
+        self._hud_bg = None
+
+    def _build_background(self):
+        """
+        Render the grass field once; it never changes during play.
+
+        Returns:
+            Screen-sized pygame Surface
+        """
+        width, height = self._width, self._height
+        background = pygame.Surface((width, height))
+        background.fill((34, 139, 34))
+
+        # Simple "grass" pattern
+        for x in range(0, width, 40):
+            for y in range(0, height, 40):
+                pygame.draw.rect(background, (40, 150, 40), (x + 5, y + 5, 10, 10))
+
+        return to_display_format(background)
+
+    def _build_hud(self):
+        """Render the back button label, HUD text and HUD backdrop once."""
+        self._back_text = to_display_format(self.font.render("Back", True, (255, 255, 255)), alpha=True)
+        hud_text = self.font.render(
+            f"Character: {self.character.name} | WASD/Arrows or CLICK to move | B: Back | ESC: Quit",
+            True, (255, 255, 255)
+        )
+        self._hud_text = to_display_format(hud_text, alpha=True)
+        # Translucent background for the text
+        hud_bg = to_display_format(pygame.Surface((hud_text.get_width() + 20, hud_text.get_height() + 10)))
+        hud_bg.fill((0, 0, 0))
+        hud_bg.set_alpha(128)
+        self._hud_bg = hud_bg
+
+    def _render_marker(self, timer):
+        """
+        Render one frame of the click-to-move target marker.
+
+        Args:
+            timer: Remaining marker frames (1 to MARKER_FRAMES)
+
+        Returns:
+            Tuple of (pygame Surface with per-pixel alpha, (half width, half height))
+        """
+        # Pulsing circle effect
+        pulse = (timer % 20) / 20.0
+        radius = int(8 + pulse * 4)
+        alpha = int(255 * (timer / float(self.MARKER_FRAMES)))
+
+        # Create a surface for the marker with alpha
+        marker_surface = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
+        color_with_alpha = (255, 255, 100, alpha)
+        pygame.draw.circle(marker_surface, color_with_alpha, (radius + 2, radius + 2), radius, 2)
+
+        # Draw X in the center
+        pygame.draw.line(marker_surface, color_with_alpha,
+                       (radius - 3, radius - 3), (radius + 7, radius + 7), 2)
+        pygame.draw.line(marker_surface, color_with_alpha,
+                       (radius + 7, radius - 3), (radius - 3, radius + 7), 2)
+
+        return to_display_format(marker_surface, alpha=True), (radius + 2, radius + 2)
+
+    @property
+    def target_pos(self):
+        """Target position for click-to-move, or None."""
+        return self._target_pos
+
+    @target_pos.setter
+    def target_pos(self, pos):
+        """
+        Set the click-to-move target and compute the velocity toward it once.
+
+        Args:
+            pos: Target (x, y) position, or None to stop
+        """
+        self._target_pos = pos
+        if pos is None:
+            return
+
+        # Direction from the character's center to the target
+        dist_x = pos[0] - (self.character.x + self.character.size // 2)
+        dist_y = pos[1] - (self.character.y + self.character.size // 2)
+        distance = math.hypot(dist_x, dist_y)
+
+        # Normalize direction and apply speed; update() counts down the distance
+        self._target_remaining = distance
+        if distance:
+            self._target_vel = ((dist_x / distance) * self.character.speed,
+                                (dist_y / distance) * self.character.speed)
+        else:
+            self._target_vel = (0, 0)
+
     def handle_event(self, event):
         """
         Handle game events.
@@ -73,7 +184,7 @@ class Game:
                 else:
                     # Set target position for click-to-move
                     self.target_pos = event.pos
-                    self.target_marker_timer = 60  # Show marker for 60 frames (1 second at 60 FPS)
+                    self.target_marker_timer = self.MARKER_FRAMES
 
     def update(self, keys):
         """
@@ -87,43 +198,39 @@ class Game:
 
         # Keyboard movement (takes priority over click-to-move)
         keyboard_input = False
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            dy = -self.character.speed
+        speed = self.character.speed
+        if keys[_K_UP] or keys[_K_W]:
+            dy = -speed
             keyboard_input = True
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            dy = self.character.speed
+        if keys[_K_DOWN] or keys[_K_S]:
+            dy = speed
             keyboard_input = True
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dx = -self.character.speed
+        if keys[_K_LEFT] or keys[_K_A]:
+            dx = -speed
             keyboard_input = True
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx = self.character.speed
+        if keys[_K_RIGHT] or keys[_K_D]:
+            dx = speed
             keyboard_input = True
 
         # If keyboard input is active, cancel click-to-move
+        click_moving = False
         if keyboard_input:
             self.target_pos = None
-        # Otherwise, handle click-to-move
-        elif self.target_pos:
-            # Calculate direction to target
-            char_center_x = self.character.x + self.character.size // 2
-            char_center_y = self.character.y + self.character.size // 2
-            target_x, target_y = self.target_pos
-
-            # Calculate distance
-            dist_x = target_x - char_center_x
-            dist_y = target_y - char_center_y
-            distance = math.sqrt(dist_x ** 2 + dist_y ** 2)
-
+        # Otherwise, handle click-to-move along the velocity set with the target
+        elif self._target_pos:
             # If close enough to target, stop
-            if distance < self.character.speed:
+            if self._target_remaining < speed:
                 self.target_pos = None
             else:
-                # Normalize direction and apply speed
-                dx = (dist_x / distance) * self.character.speed
-                dy = (dist_y / distance) * self.character.speed
+                dx, dy = self._target_vel
+                self._target_remaining -= speed
+                click_moving = True
 
-        self.character.move(dx, dy, self.screen.get_width(), self.screen.get_height())
+        old_x, old_y = self.character.x, self.character.y
+        self.character.move(dx, dy, self._width, self._height)
+        if click_moving and (self.character.x != old_x + dx or self.character.y != old_y + dy):
+            # Blocked by the screen edge; re-aim from where the character is
+            self.target_pos = self._target_pos
 
         # Update target marker timer
         if self.target_marker_timer > 0:
@@ -131,58 +238,37 @@ class Game:
 
     def draw(self):
         """Draw the game screen."""
-        # Draw background (grass-like)
-        self.screen.fill((34, 139, 34))
-
-        # Draw simple "grass" pattern
-        for x in range(0, self.screen.get_width(), 40):
-            for y in range(0, self.screen.get_height(), 40):
-                pygame.draw.rect(self.screen, (40, 150, 40), (x + 5, y + 5, 10, 10))
+        # Draw background (grass-like), pre-rendered in one blit
+        self.screen.blit(self._background, (0, 0))
 
         # Draw target marker if active
         if self.target_marker_timer > 0 and self.target_pos:
-            # Pulsing circle effect
-            pulse = (self.target_marker_timer % 20) / 20.0
-            radius = int(8 + pulse * 4)
-            alpha = int(255 * (self.target_marker_timer / 60.0))
-
-            # Create a surface for the marker with alpha
-            marker_surface = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
-            color_with_alpha = (255, 255, 100, alpha)
-            pygame.draw.circle(marker_surface, color_with_alpha, (radius + 2, radius + 2), radius, 2)
-
-            # Draw X in the center
-            pygame.draw.line(marker_surface, color_with_alpha,
-                           (radius - 3, radius - 3), (radius + 7, radius + 7), 2)
-            pygame.draw.line(marker_surface, color_with_alpha,
-                           (radius + 7, radius - 3), (radius - 3, radius + 7), 2)
-
+            if self._marker_frames is None:
+                self._marker_frames = [self._render_marker(timer)
+                                       for timer in range(1, self.MARKER_FRAMES + 1)]
+            marker_surface, (half_width, half_height) = self._marker_frames[self.target_marker_timer - 1]
             self.screen.blit(marker_surface,
-                           (self.target_pos[0] - radius - 2, self.target_pos[1] - radius - 2))
+                           (self.target_pos[0] - half_width, self.target_pos[1] - half_height))
 
         # Draw character
-        self.screen.blit(self.sprite, (self.character.x, self.character.y))
+        # Positions are floats during click-to-move; floor once so the blit
+        # gets integer coordinates (movement keeps its sub-pixel precision)
+        self.screen.blit(self.sprite, (int(self.character.x), int(self.character.y)))
 
         # Draw back button
         button_color = (100, 100, 200) if self.back_button_hovered else (70, 70, 150)
         pygame.draw.rect(self.screen, button_color, self.back_button_rect, border_radius=5)
         pygame.draw.rect(self.screen, (200, 200, 255), self.back_button_rect, 2, border_radius=5)
 
-        back_text = self.font.render("Back", True, (255, 255, 255))
-        back_text_rect = back_text.get_rect(center=self.back_button_rect.center)
-        self.screen.blit(back_text, back_text_rect)
+        if self._hud_text is None:
+            self._build_hud()
 
-        # Draw HUD
-        char_info = self.font.render(
-            f"Character: {self.character.name} | WASD/Arrows or CLICK to move | B: Back | ESC: Quit",
-            True, (255, 255, 255)
-        )
-        # Draw background for text
-        text_bg = pygame.Surface((char_info.get_width() + 20, char_info.get_height() + 10))
-        text_bg.fill((0, 0, 0))
-        text_bg.set_alpha(128)
-        self.screen.blit(text_bg, (10, 10))
-        self.screen.blit(char_info, (20, 15))
+        back_text_rect = self._back_text.get_rect(center=self.back_button_rect.center)
+        self.screen.blit(self._back_text, back_text_rect)
+
+        # Draw HUD over its translucent background
+        self.screen.blit(self._hud_bg, (10, 10))
+        self.screen.blit(self._hud_text, (20, 15))
 
     def is_running(self):
         """Check if the game is still running."""
@@ -8,10 +8,10 @@ Main entry point for the Zelda-style Python game.
 Compatible with both desktop and WASM (pygbag) deployment.
 """
 import asyncio
+import contextlib
 import pygame
 import sys
 from character_selection import CharacterSelectionScreen, CREATE_CUSTOM_INDEX
-from character_creator import run_character_creator
 from game import Game
 
 # Import platform for WASM-specific functionality
@@ -19,16 +19,24 @@ if sys.platform == "emscripten":
     import platform
 
 
+# Canvas DOM element, looked up once on first use; each DOM call crosses
+# the JS/WASM boundary
+_canvas = None
+
+
 def restore_canvas_focus():
     """
     Restore focus to the pygame canvas.
     This is needed on WASM/mobile to ensure mouse/touch events are captured
     after focus has been lost (e.g., after using HTML input elements).
     """
+    global _canvas
     if sys.platform == "emscripten":
         try:
             # Try to focus the canvas element
-            canvas = platform.window.document.getElementById("canvas")
+            if _canvas is None:
+                _canvas = platform.window.document.getElementById("canvas")
+            canvas = _canvas
             if canvas:
                 canvas.focus()
             # Also focus the window for good measure
@@ -37,19 +45,57 @@ def restore_canvas_focus():
             print(f"Failed to restore canvas focus: {e}")
 
 
+def poll_events():
+    """
+    Get pending events, skipping the list allocation when the queue is empty.
+
+    peek() already pumps the queue, so get() is told not to pump again.
+
+    Returns:
+        List (or empty tuple) of pending pygame events
+    """
+    if not pygame.event.peek():
+        return ()
+    return pygame.event.get(pump=False)
+
+
+@contextlib.contextmanager
+def mouse_motion_blocked():
+    """
+    Keep MOUSEMOTION events out of the queue for the duration of the block.
+
+    The selection screen polls the pointer position once per frame instead of
+    handling every motion event; the creator and game read motion events, so
+    they are allowed again on exit.
+    """
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
+    try:
+        yield
+    finally:
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+
+
 async def main():
     """Main game loop - async for WASM compatibility."""
-    # Initialize Pygame
-    pygame.init()
+    # Initialize only the subsystems the game uses (no mixer or joystick
+    # probing, which is slow in the browser); video covers keyboard and mouse
+    pygame.display.init()
+    pygame.font.init()
 
     # Set up the display
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF)
     pygame.display.set_caption("Zelda-Style Adventure")
 
     clock = pygame.time.Clock()
     FPS = 60
+    MENU_FPS = 30  # Menus are static between inputs and don't need 60 Hz
+
+    # Created once and reused each time the player returns to selection,
+    # so fonts and cached sprites are only built on first use
+    selection_screen = CharacterSelectionScreen(screen)
+    creator = None  # Character creator, built on first use and reused after
 
     # Main game loop - allows returning to character selection
     keep_playing = True
@@ -58,56 +104,71 @@ async def main():
         # Ensure canvas has focus for mouse/touch events
         restore_canvas_focus()
 
-        selection_screen = CharacterSelectionScreen(screen)
+        selection_screen.reset_selection()
         selected_character_index = None
         custom_character = None
 
-        while selected_character_index is None:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-                result = selection_screen.handle_event(event)
-                if result is not None:
-                    selected_character_index = result
-
-            selection_screen.draw()
-            pygame.display.flip()
-            clock.tick(FPS)
-            await asyncio.sleep(0)  # Required for WASM compatibility
+        with mouse_motion_blocked():
+            while selected_character_index is None:
+                events = poll_events()
+                # Hover is read after the queue is pumped so a click handled
+                # this frame sees the pointer where it landed
+                selection_screen.update_hover(pygame.mouse.get_pos())
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        return
+
+                    result = selection_screen.handle_event(event)
+                    if result is not None:
+                        selected_character_index = result
+
+                # Only regions that changed are pushed to the display
+                pygame.display.update(selection_screen.draw())
+                clock.tick(MENU_FPS)
+                await asyncio.sleep(0)  # Required for WASM compatibility
 
         # Handle custom character creation if selected
         # Loop until we have a valid character (either custom or preset)
         while selected_character_index == CREATE_CUSTOM_INDEX and custom_character is None:
-            custom_character = await run_character_creator(screen)
+            if creator is None:
+                # Imported on first use so players who never open the creator
+                # don't load it at startup
+                from character_creator import CharacterCreator
+                creator = CharacterCreator(screen)
+            else:
+                creator.reset()  # Keep its rendered assets, start a fresh character
+            custom_character = await creator.run()
             # Restore canvas focus after character creator
             restore_canvas_focus()
 
             if custom_character is None:
-                # User cancelled, go back to selection
+                # User cancelled, go back to selection (the creator drew over it)
                 selected_character_index = None
-                while selected_character_index is None:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            pygame.quit()
-                            return
-
-                        result = selection_screen.handle_event(event)
-                        if result is not None:
-                            selected_character_index = result
-
-                    selection_screen.draw()
-                    pygame.display.flip()
-                    clock.tick(FPS)
-                    await asyncio.sleep(0)
+                selection_screen.invalidate()
+                with mouse_motion_blocked():
+                    while selected_character_index is None:
+                        events = poll_events()
+                        selection_screen.update_hover(pygame.mouse.get_pos())
+                        for event in events:
+                            if event.type == pygame.QUIT:
+                                pygame.quit()
+                                return
+
+                            result = selection_screen.handle_event(event)
+                            if result is not None:
+                                selected_character_index = result
+
+                        pygame.display.update(selection_screen.draw())
+                        clock.tick(MENU_FPS)
+                        await asyncio.sleep(0)
                 # Loop will check if selected_character_index is CREATE_CUSTOM_INDEX again
 
         # Game phase - pass character index or custom character
         game = Game(screen, selected_character_index, custom_character=custom_character)
 
         while game.is_running():
-            for event in pygame.event.get():
+            for event in poll_events():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     return
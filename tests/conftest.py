@@ -0,0 +1,67 @@
+"""
+Shared test fixtures.
+"""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Quiet pygame's import banner and keep SDL off real devices; set before
+# any test module imports pygame
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+# Add parent directory to path (once, before any test module is collected)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def isolated_font_cache():
+    """Give each test an empty font cache so patched Font mocks don't leak between tests."""
+    with patch.dict('fonts._fonts', clear=True):
+        yield
+
+
+@pytest.fixture(scope="session")
+def screen():
+    """A real 800x600 surface, shared by tests that don't inspect screen calls."""
+    return pygame.Surface((800, 600))
+
+
+@pytest.fixture(scope="module")
+def _module_screen():
+    """Build the 800x600 mock display once per test module."""
+    screen = Mock()
+    screen.get_width.return_value = 800
+    screen.get_height.return_value = 600
+    return screen
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _font_module():
+    """Initialize pygame's font module once for the whole run.
+
+    With the dummy video driver no window is needed, so screens load and
+    render with real fonts instead of a Font mock.
+    """
+    pygame.font.init()
+    yield
+    pygame.font.quit()
+
+
+@pytest.fixture
+def mock_screen(_module_screen):
+    """The module's mock display, with call history from earlier tests cleared."""
+    _module_screen.reset_mock()
+    return _module_screen
+
+
+@pytest.fixture
+def mock_font():
+    """Patch pygame.font.Font for tests that count text rendering."""
+    with patch('pygame.font.Font') as font:
+        yield font
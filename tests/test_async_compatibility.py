@@ -1,203 +1,225 @@
 """
 Tests for async/WASM compatibility of the game.
 """
+import ast
 import asyncio
 import inspect
+import itertools
+from contextlib import ExitStack
+from types import SimpleNamespace
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import pygame
 
 
+@pytest.fixture(scope="module")
+def main_module():
+    """Import main once for the module.
+
+    main.py does no pygame work at import time, so no patches are needed
+    here; tests patch main's attributes around the calls they make.
+    """
+    import main
+    return main
+
+
+@pytest.fixture(scope="module")
+def main_source(main_module):
+    """Read main.py once for the static checks.
+
+    Returns:
+        str: the source text of main.py
+    """
+    with open(main_module.__file__, 'r') as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module")
+def main_fn(main_source):
+    """Parse main.py once and return the ``async def main()`` node."""
+    tree = ast.parse(main_source)
+    return next((node for node in ast.walk(tree)
+                 if isinstance(node, ast.AsyncFunctionDef) and node.name == 'main'), None)
+
+
+def _is_call(node, owner, attr):
+    """Return True if node is a call of the form owner.attr(...)."""
+    return (isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == attr
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == owner)
+
+
+@pytest.fixture
+def patched_main_env():
+    """Patch everything main() touches so it can run without a display.
+
+    Yields:
+        SimpleNamespace: the mocks tests configure (display, events,
+        selection_class, game_class, keys)
+    """
+    with ExitStack() as stack:
+        def start(target, **kwargs):
+            return stack.enter_context(patch(target, **kwargs))
+
+        for target in ('main.pygame.display.init', 'main.pygame.font.init',
+                       'main.pygame.display.set_caption', 'main.pygame.time.Clock',
+                       'main.pygame.event.set_blocked', 'main.pygame.event.set_allowed',
+                       'main.pygame.display.flip', 'main.pygame.display.update',
+                       'main.pygame.quit'):
+            start(target)
+        start('main.pygame.event.peek', return_value=True)
+        start('main.pygame.mouse.get_pos', return_value=(0, 0))
+
+        yield SimpleNamespace(
+            display=start('main.pygame.display.set_mode'),
+            events=start('main.pygame.event.get'),
+            keys=start('main.pygame.key.get_pressed'),
+            selection_class=start('main.CharacterSelectionScreen'),
+            game_class=start('main.Game'),
+        )
+
+
 class TestAsyncCompatibility:
     """Test cases for async compatibility features."""
 
-    def test_main_is_async_function(self):
+    def test_main_is_async_function(self, main_module):
         """Test that main() is defined as an async function."""
-        from main import main
-        assert inspect.iscoroutinefunction(main), "main() should be an async function"
+        assert inspect.iscoroutinefunction(main_module.main), "main() should be an async function"
 
-    @pytest.mark.asyncio
-    async def test_main_can_run_with_asyncio(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_main_can_run_with_asyncio(self, main_module, patched_main_env):
         """Test that main() can be executed with asyncio."""
-        from main import main
-
-        # Mock pygame to prevent actual window creation
-        with patch('main.pygame.init'), \
-             patch('main.pygame.display.set_mode') as mock_display, \
-             patch('main.pygame.display.set_caption'), \
-             patch('main.pygame.time.Clock'), \
-             patch('main.pygame.event.get') as mock_events, \
-             patch('main.pygame.display.flip'), \
-             patch('main.pygame.quit'), \
-             patch('main.CharacterSelectionScreen') as mock_selection, \
-             patch('main.Game') as mock_game:
-
-            # Setup mocks
-            mock_screen = Mock()
-            mock_display.return_value = mock_screen
-
-            # Simulate QUIT event on first call to exit the selection loop
-            quit_event = Mock()
-            quit_event.type = pygame.QUIT
-            mock_events.return_value = [quit_event]
-
-            # Run main and verify it completes without error
-            try:
-                await asyncio.wait_for(main(), timeout=1.0)
-            except asyncio.TimeoutError:
-                pytest.fail("main() took too long to execute or has infinite loop without await")
-
-    def test_pep_723_metadata_present(self):
-        """Test that PEP 723 metadata is present in main.py for pygbag."""
-        with open('main.py', 'r') as f:
-            content = f.read()
+        # Setup mocks
+        patched_main_env.display.return_value = Mock()
 
-        # Check for PEP 723 script metadata
-        assert '# /// script' in content, "PEP 723 metadata block should be present"
-        assert '# dependencies = [' in content, "Dependencies section should be present"
-        assert 'pygame' in content, "pygame should be listed in dependencies"
-
-    def test_no_sys_exit_in_loops(self):
-        """Test that sys.exit() is not called in the main game loops."""
-        with open('main.py', 'r') as f:
-            lines = f.readlines()
+        # Simulate QUIT event on first call to exit the selection loop
+        quit_event = Mock()
+        quit_event.type = pygame.QUIT
+        patched_main_env.events.return_value = [quit_event]
 
-        # Find the async def main() line
-        main_start = None
-        for i, line in enumerate(lines):
-            if 'async def main():' in line:
-                main_start = i
-                break
+        # Run main and verify it completes; a TimeoutError fails the test
+        async with asyncio.timeout(0.2):
+            await main_module.main()
 
-        assert main_start is not None, "async def main() should be defined"
+    def test_pep_723_metadata_present(self, main_source):
+        """Test that PEP 723 metadata is present in main.py for pygbag."""
+        # Check for PEP 723 script metadata
+        assert '# /// script' in main_source, "PEP 723 metadata block should be present"
+        assert '# dependencies = [' in main_source, "Dependencies section should be present"
+        assert 'pygame' in main_source, "pygame should be listed in dependencies"
 
-        # Check that sys.exit() is not used in the main function
-        main_content = ''.join(lines[main_start:])
+    def test_no_sys_exit_in_loops(self, main_fn):
+        """Test that sys.exit() is not called in the main game loops."""
+        assert main_fn is not None, "async def main() should be defined"
 
         # sys.exit should not appear in the main function body
         # (it's only used in event handlers which now use return)
-        import re
-        sys_exit_calls = re.findall(r'\s+sys\.exit\(\)', main_content)
-        assert len(sys_exit_calls) == 0, "sys.exit() should not be called in main function"
+        assert not any(_is_call(node, 'sys', 'exit') for node in ast.walk(main_fn)), \
+            "sys.exit() should not be called in main function"
 
-    def test_asyncio_sleep_in_loops(self):
+    def test_asyncio_sleep_in_loops(self, main_source):
         """Test that asyncio.sleep(0) is present in game loops."""
-        with open('main.py', 'r') as f:
-            content = f.read()
-
         # Check for asyncio.sleep(0) calls
-        assert 'await asyncio.sleep(0)' in content, "await asyncio.sleep(0) should be in game loops"
+        assert 'await asyncio.sleep(0)' in main_source, "await asyncio.sleep(0) should be in game loops"
 
         # Count occurrences - should have at least 2 (selection loop and game loop)
-        count = content.count('await asyncio.sleep(0)')
+        count = main_source.count('await asyncio.sleep(0)')
         assert count >= 2, f"Expected at least 2 await asyncio.sleep(0) calls, found {count}"
 
-    def test_asyncio_run_at_end(self):
+    def test_asyncio_run_at_end(self, main_source):
         """Test that asyncio.run(main()) is used at the end of the file."""
-        with open('main.py', 'r') as f:
-            content = f.read()
-
-        assert 'asyncio.run(main())' in content, "asyncio.run(main()) should be at the end"
+        assert 'asyncio.run(main())' in main_source, "asyncio.run(main()) should be at the end"
 
-    def test_pygame_quit_not_followed_by_sys_exit(self):
+    def test_pygame_quit_not_followed_by_sys_exit(self, main_fn):
         """Test that pygame.quit() calls are followed by return, not sys.exit()."""
-        with open('main.py', 'r') as f:
-            lines = f.readlines()
-
-        for i, line in enumerate(lines):
-            if 'pygame.quit()' in line:
-                # Check the next few lines for sys.exit()
-                # In the async version, quit should be followed by return or end of function
-                next_lines = ''.join(lines[i:min(i+5, len(lines))])
-                if i < len(lines) - 5:  # Not at the very end
-                    # If not the final pygame.quit(), it should be followed by return
-                    if 'if event.type == pygame.QUIT:' in ''.join(lines[max(0,i-5):i]):
-                        assert 'return' in next_lines, f"pygame.quit() at line {i+1} should be followed by return"
+        for node in ast.walk(main_fn):
+            # In the async version, each QUIT handler should quit and return
+            if not isinstance(node, ast.If) or 'pygame.QUIT' not in ast.unparse(node.test):
+                continue
+            for stmt in node.body:
+                if isinstance(stmt, ast.Expr) and _is_call(stmt.value, 'pygame', 'quit'):
+                    assert any(isinstance(s, ast.Return) for s in node.body), \
+                        f"pygame.quit() at line {stmt.lineno} should be followed by return"
 
 
 class TestAsyncIntegration:
     """Integration tests for async game loop."""
 
-    @pytest.mark.asyncio
-    async def test_character_selection_loop_with_asyncio(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_character_selection_loop_with_asyncio(self, main_module, patched_main_env):
         """Test character selection loop works with asyncio."""
-        from main import main
-
-        with patch('main.pygame.init'), \
-             patch('main.pygame.display.set_mode') as mock_display, \
-             patch('main.pygame.display.set_caption'), \
-             patch('main.pygame.time.Clock') as mock_clock, \
-             patch('main.pygame.event.get') as mock_events, \
-             patch('main.pygame.display.flip'), \
-             patch('main.pygame.quit'), \
-             patch('main.CharacterSelectionScreen') as mock_selection_class, \
-             patch('main.Game'):
-
-            # Setup
-            mock_screen = Mock()
-            mock_display.return_value = mock_screen
-            mock_selection = Mock()
-            mock_selection_class.return_value = mock_selection
-
-            # First call returns None (no selection), second returns QUIT
-            quit_event = Mock()
-            quit_event.type = pygame.QUIT
-            mock_events.return_value = [quit_event]
-            mock_selection.handle_event.return_value = None
-
-            # Should complete without hanging
-            try:
-                await asyncio.wait_for(main(), timeout=2.0)
-                assert True, "Selection loop completed with asyncio"
-            except asyncio.TimeoutError:
-                pytest.fail("Character selection loop did not yield control to asyncio")
-
-    @pytest.mark.asyncio
-    async def test_game_loop_with_asyncio(self):
+        # Setup
+        patched_main_env.display.return_value = Mock()
+        mock_selection = Mock()
+        patched_main_env.selection_class.return_value = mock_selection
+
+        # First call returns None (no selection), second returns QUIT
+        quit_event = Mock()
+        quit_event.type = pygame.QUIT
+        patched_main_env.events.return_value = [quit_event]
+        mock_selection.handle_event.return_value = None
+
+        # Should complete without hanging; a TimeoutError fails the test
+        async with asyncio.timeout(0.2):
+            await main_module.main()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_selection_hover_read_after_events_polled(self, main_module, patched_main_env):
+        """Test hover uses the pointer position pumped in the same frame as clicks."""
+        patched_main_env.display.return_value = Mock()
+        mock_selection = Mock()
+        patched_main_env.selection_class.return_value = mock_selection
+        quit_event = Mock()
+        quit_event.type = pygame.QUIT
+        patched_main_env.events.return_value = [quit_event]
+
+        # Record the order of the queue read and the hover update
+        calls = Mock()
+        calls.attach_mock(patched_main_env.events, 'get')
+        calls.attach_mock(mock_selection.update_hover, 'update_hover')
+
+        async with asyncio.timeout(0.2):
+            await main_module.main()
+
+        assert [c[0] for c in calls.mock_calls] == ['get', 'update_hover']
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_game_loop_with_asyncio(self, main_module, patched_main_env):
         """Test main game loop works with asyncio."""
-        from main import main
-
-        with patch('main.pygame.init'), \
-             patch('main.pygame.display.set_mode') as mock_display, \
-             patch('main.pygame.display.set_caption'), \
-             patch('main.pygame.time.Clock'), \
-             patch('main.pygame.event.get') as mock_events, \
-             patch('main.pygame.display.flip'), \
-             patch('main.pygame.quit'), \
-             patch('main.pygame.key.get_pressed') as mock_keys, \
-             patch('main.CharacterSelectionScreen') as mock_selection_class, \
-             patch('main.Game') as mock_game_class:
-
-            # Setup mocks
-            mock_screen = Mock()
-            mock_display.return_value = mock_screen
-            mock_selection = Mock()
-            mock_selection_class.return_value = mock_selection
-            mock_game = Mock()
-            mock_game_class.return_value = mock_game
-
-            # Sequence: character selected on first try, then game quits
-            select_event = Mock()
-            select_event.type = pygame.KEYDOWN
-            quit_event = Mock()
-            quit_event.type = pygame.QUIT
-
-            call_count = [0]
-            def event_side_effect():
-                call_count[0] += 1
-                if call_count[0] == 1:
-                    return [select_event]  # Selection screen
-                else:
-                    return [quit_event]  # Game screen
-
-            mock_events.side_effect = event_side_effect
-            mock_selection.handle_event.return_value = 0  # Select first character
-            mock_game.is_running.return_value = True
-            mock_keys.return_value = {}
-
-            # Should complete without hanging
-            try:
-                await asyncio.wait_for(main(), timeout=2.0)
-                assert True, "Game loop completed with asyncio"
-            except asyncio.TimeoutError:
-                pytest.fail("Game loop did not yield control to asyncio")
+        # Setup mocks
+        patched_main_env.display.return_value = Mock()
+        mock_selection = Mock()
+        patched_main_env.selection_class.return_value = mock_selection
+        mock_game = Mock()
+        patched_main_env.game_class.return_value = mock_game
+
+        # Sequence: character selected on first try, then game quits
+        select_event = Mock()
+        select_event.type = pygame.KEYDOWN
+        quit_event = Mock()
+        quit_event.type = pygame.QUIT
+
+        # Selection screen gets the select event, the game screen gets QUIT
+        patched_main_env.events.side_effect = itertools.chain(
+            [[select_event]], itertools.repeat([quit_event]))
+        mock_selection.handle_event.return_value = 0  # Select first character
+        mock_game.is_running.return_value = True
+        patched_main_env.keys.return_value = {}
+
+        # Should complete without hanging; a TimeoutError fails the test
+        async with asyncio.timeout(0.2):
+            await main_module.main()
+
+    def test_poll_events_skips_get_when_queue_empty(self, main_module):
+        """Test that an empty queue is detected with peek() alone."""
+        with patch('main.pygame.event.peek', return_value=False), \
+             patch('main.pygame.event.get') as mock_get:
+            assert list(main_module.poll_events()) == []
+            mock_get.assert_not_called()
+
+        with patch('main.pygame.event.peek', return_value=True), \
+             patch('main.pygame.event.get') as mock_get:
+            assert main_module.poll_events() is mock_get.return_value
+            mock_get.assert_called_once_with(pump=False)
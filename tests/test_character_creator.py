@@ -2,59 +2,104 @@
 Tests for the character creator module.
 """
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 import pygame
+from pygame import Rect
 from characters import Character
+from character_creator import CharacterCreator, _coalesce_mouse_motion
+
+
+def _feed_keys(creator, *keys):
+    """Send a KEYDOWN for each key, reusing one event object.
+
+    Args:
+        creator: CharacterCreator under test
+        *keys: pygame key codes, or (key, unicode) pairs for text keys
+
+    Returns:
+        Result of the last handle_event call
+    """
+    event = SimpleNamespace(type=pygame.KEYDOWN, key=None, unicode='')
+    result = None
+    for key in keys:
+        event.key, event.unicode = key if isinstance(key, tuple) else (key, '')
+        result = creator.handle_event(event)
+    return result
+
+
+class _FakeSurface:
+    """Plain stand-in for pygame.Surface; drawing onto it does nothing."""
+
+    def __init__(self, size, *args, **kwargs):
+        self._size = tuple(size)
+
+    def get_size(self):
+        return self._size
+
+    def get_width(self):
+        return self._size[0]
+
+    def get_height(self):
+        return self._size[1]
+
+    def get_rect(self, **kwargs):
+        rect = Rect((0, 0), self._size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def _draw(self, *args, **kwargs):
+        pass
+
+    fill = blit = blits = fblits = set_colorkey = _draw
 
 
 class TestCharacterCreator(unittest.TestCase):
     """Test cases for the CharacterCreator class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Patch pygame once for the whole class."""
         # Mock pygame to avoid actual initialization
-        self.screen_mock = Mock()
-        self.screen_mock.get_width.return_value = 800
-        self.screen_mock.get_height.return_value = 600
-
-        # Set up pygame mocks
-        self.pygame_patches = [
+        cls.pygame_patches = [
             patch('character_creator.pygame.font.Font'),
-            patch('character_creator.pygame.Surface'),
+            patch('character_creator.pygame.Surface', _FakeSurface),
             patch('character_creator.pygame.draw.rect'),
             patch('character_creator.pygame.draw.line'),
-            patch('character_creator.pygame.Rect'),
             patch('character_creator.pygame.key.start_text_input'),
             patch('character_creator.pygame.key.stop_text_input'),
             patch('character_creator.pygame.key.set_text_input_rect'),
         ]
 
         # Start all patches
-        self.mocks = [p.start() for p in self.pygame_patches]
+        cls.mocks = [p.start() for p in cls.pygame_patches]
 
         # Configure Font mock
         mock_font_instance = Mock()
-        mock_font_instance.render = Mock(return_value=Mock(get_width=Mock(return_value=100)))
-        self.mocks[0].return_value = mock_font_instance
+        mock_font_instance.render = Mock(return_value=_FakeSurface((100, 20)))
+        cls.mocks[0].return_value = mock_font_instance
 
-        # Configure Surface mock to return proper mock instances
-        def surface_side_effect(*args, **kwargs):
-            mock_surf = Mock()
-            mock_surf.fill = Mock()
-            mock_surf.get_width = Mock(return_value=100)
-            return mock_surf
+        # One mock screen for the class; setUp clears its history
+        cls.screen_mock = Mock()
+        cls.screen_mock.get_width.return_value = 800
+        cls.screen_mock.get_height.return_value = 600
 
-        self.mocks[1].side_effect = surface_side_effect
-
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up patches."""
-        for p in self.pygame_patches:
+        for p in cls.pygame_patches:
             p.stop()
 
+    def setUp(self):
+        """Set up test fixtures."""
+        # Clear call history left by earlier tests; configuration is kept
+        for mock in self.mocks + [self.screen_mock]:
+            if isinstance(mock, Mock):
+                mock.reset_mock()
+
     def test_character_creator_initialization(self):
         """Test that CharacterCreator initializes correctly."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
 
         # Check initial state
@@ -66,8 +111,6 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_name_input_handling(self):
         """Test that name is auto-generated and can be manually set."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
 
         # Test that name is auto-generated
@@ -80,28 +123,18 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_backspace_handling(self):
         """Test that backspace key doesn't affect auto-generated name."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         original_name = creator.name
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_BACKSPACE
-
-        creator.handle_event(event)
+        _feed_keys(creator, pygame.K_BACKSPACE, pygame.K_BACKSPACE)
         # Name should remain unchanged
         self.assertEqual(creator.name, original_name)
 
     def test_space_handling(self):
         """Test SPACE key creates character."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_SPACE
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_SPACE)
 
         result = creator.handle_event(event)
         # SPACE should now create the character
@@ -110,29 +143,18 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_name_length_limit(self):
         """Test name is limited to 20 characters."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name = "12345678901234567890"  # 20 chars
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_a
-        event.unicode = 'a'
-
-        creator.handle_event(event)
+        _feed_keys(creator, (pygame.K_a, 'a'), (pygame.K_b, 'b'))
         self.assertEqual(len(creator.name), 20)  # Should not exceed 20
 
     def test_tab_switches_modes(self):
         """Test TAB key no longer has special handling (removed name input mode)."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         original_slider = creator.active_slider
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_TAB
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_TAB)
 
         result = creator.handle_event(event)
         # TAB should not do anything now
@@ -141,64 +163,37 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_color_slider_navigation(self):
         """Test arrow keys navigate color sliders."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.active_slider = 0
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_DOWN
-
-        creator.handle_event(event)
-        self.assertEqual(creator.active_slider, 1)
-
-        creator.handle_event(event)
-        self.assertEqual(creator.active_slider, 2)
-
-        # Should wrap around
-        creator.handle_event(event)
-        self.assertEqual(creator.active_slider, 0)
-
-        # Test UP key
-        event.key = pygame.K_UP
-        creator.handle_event(event)
-        self.assertEqual(creator.active_slider, 2)
+        # DOWN steps through the sliders and wraps around; UP goes back
+        for key, expected in [(pygame.K_DOWN, 1), (pygame.K_DOWN, 2),
+                              (pygame.K_DOWN, 0), (pygame.K_UP, 2)]:
+            with self.subTest(key=pygame.key.name(key), expected=expected):
+                creator.handle_event(SimpleNamespace(type=pygame.KEYDOWN, key=key))
+                self.assertEqual(creator.active_slider, expected)
 
     def test_color_value_adjustment(self):
         """Test left/right arrows adjust color values."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name_input_active = False
         creator.active_slider = 0
         creator.body_color = [128, 128, 128]
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_RIGHT
-
-        # Increase red value
-        creator.handle_event(event)
-        self.assertEqual(creator.body_color[0], 133)
-
-        # Decrease red value
-        event.key = pygame.K_LEFT
-        creator.handle_event(event)
-        self.assertEqual(creator.body_color[0], 128)
+        # Increase, then decrease, the red value
+        for key, expected in [(pygame.K_RIGHT, 133), (pygame.K_LEFT, 128)]:
+            with self.subTest(key=pygame.key.name(key), expected=expected):
+                creator.handle_event(SimpleNamespace(type=pygame.KEYDOWN, key=key))
+                self.assertEqual(creator.body_color[0], expected)
 
     def test_color_value_bounds(self):
         """Test color values stay within 0-255 bounds."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name_input_active = False
         creator.active_slider = 0
         creator.body_color = [255, 128, 128]
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_RIGHT
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_RIGHT)
 
         # Try to increase beyond 255
         creator.handle_event(event)
@@ -212,79 +207,48 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_preset_selection(self):
         """Test preset color selection with number keys."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name_input_active = False
 
-        # Test Knight preset (1 key)
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_1
-        creator.handle_event(event)
-        self.assertEqual(creator.body_color, [50, 100, 200])
-
-        # Test Mage preset (2 key)
-        event.key = pygame.K_2
-        creator.handle_event(event)
-        self.assertEqual(creator.body_color, [150, 50, 200])
-
-        # Test Ranger preset (3 key)
-        event.key = pygame.K_3
-        creator.handle_event(event)
-        self.assertEqual(creator.body_color, [50, 200, 100])
-
-        # Test Custom preset (4 key)
-        event.key = pygame.K_4
-        creator.handle_event(event)
-        self.assertEqual(creator.body_color, [128, 128, 128])
+        for key, name, color in [(pygame.K_1, "Knight", [50, 100, 200]),
+                                 (pygame.K_2, "Mage", [150, 50, 200]),
+                                 (pygame.K_3, "Ranger", [50, 200, 100]),
+                                 (pygame.K_4, "Custom", [128, 128, 128])]:
+            with self.subTest(preset=name):
+                creator.handle_event(SimpleNamespace(type=pygame.KEYDOWN, key=key))
+                self.assertEqual(creator.body_color, color)
 
     def test_eye_color_cycling(self):
         """Test E key cycles through eye colors."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name_input_active = False
         initial_index = creator.selected_eye_color_index
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_e
-
-        creator.handle_event(event)
+        _feed_keys(creator, pygame.K_e)
         self.assertEqual(creator.selected_eye_color_index, (initial_index + 1) % 6)
 
         # Cycle through all
-        for _ in range(5):
-            creator.handle_event(event)
+        _feed_keys(creator, *[pygame.K_e] * 5)
 
         # Should wrap back to start
         self.assertEqual(creator.selected_eye_color_index, initial_index)
 
     def test_escape_cancels_creation(self):
         """Test ESC returns False to cancel creation."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_ESCAPE
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_ESCAPE)
 
         result = creator.handle_event(event)
         self.assertFalse(result)
 
     def test_enter_without_name_returns_none(self):
         """Test ENTER always creates character (even with empty name override)."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         # Even if we manually set name to empty, auto-gen name is used in create_character
         creator.name = ""
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_RETURN
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_RETURN)
 
         result = creator.handle_event(event)
         # Should now create character with default name "Custom Hero"
@@ -293,16 +257,12 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_enter_with_name_creates_character(self):
         """Test ENTER with name creates character."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name = "Hero"
         creator.body_color = [100, 150, 200]
         creator.eye_color = (255, 100, 100)
 
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_RETURN
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_RETURN)
 
         result = creator.handle_event(event)
 
@@ -314,8 +274,6 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_create_character_method(self):
         """Test create_character returns Character with correct attributes."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name = "MyHero"
         creator.body_color = [200, 100, 50]
@@ -330,8 +288,6 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_draw_method_renders(self):
         """Test draw method renders without errors."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
         creator.name = "Test"
 
@@ -346,21 +302,212 @@ class TestCharacterCreator(unittest.TestCase):
 
     def test_update_preview_called_on_changes(self):
         """Test preview updates when character attributes change."""
-        from character_creator import CharacterCreator
-
         creator = CharacterCreator(self.screen_mock)
 
         # Change name
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_a
-        event.unicode = 'a'
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_a, unicode='a')
         creator.handle_event(event)
 
         # Preview should be updated
         creator.update_preview()
         self.assertIsNotNone(creator.preview_sprite)
 
+    def test_preset_preview_is_cached(self):
+        """Test preset previews are reused instead of re-rendered."""
+        creator = CharacterCreator(self.screen_mock)
+
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_1)
+        creator.handle_event(event)
+        creator.draw()
+        knight_preview = creator.preview_sprite
+
+        event.key = pygame.K_2
+        creator.handle_event(event)
+        creator.draw()
+        self.assertIsNot(creator.preview_sprite, knight_preview)
+
+        event.key = pygame.K_1
+        creator.handle_event(event)
+        creator.draw()
+        self.assertIs(creator.preview_sprite, knight_preview)
+
+    def test_preview_regenerated_once_per_draw(self):
+        """Test input only marks the preview dirty; draw() regenerates it."""
+        creator = CharacterCreator(self.screen_mock)
+        creator.active_slider = 0
+
+        with patch.object(creator, 'update_preview') as mock_update:
+            _feed_keys(creator, pygame.K_RIGHT, pygame.K_RIGHT)
+            mock_update.assert_not_called()
+
+            creator.draw()
+            mock_update.assert_called_once()
+
+            creator.draw()
+            mock_update.assert_called_once()
+
+    def test_unchanged_state_does_not_dirty_preview(self):
+        """Test repeated presets and clamped slider keys skip preview work."""
+        creator = CharacterCreator(self.screen_mock)
+        creator.draw()  # Consume the initial state
+
+        event = SimpleNamespace(
+            type=pygame.KEYDOWN,
+            key=pygame.K_4  # Custom is already the starting color,
+        )
+        creator.handle_event(event)
+        self.assertFalse(creator._preview_dirty)
+
+        creator.active_slider = 0
+        creator.body_color[0] = 255
+        event.key = pygame.K_RIGHT
+        creator.handle_event(event)
+        self.assertFalse(creator._preview_dirty)
+
+        event.key = pygame.K_1
+        creator.handle_event(event)
+        self.assertTrue(creator._preview_dirty)
+
+    def test_active_preset_tracks_body_color(self):
+        """Test the highlighted preset follows preset keys and slider edits."""
+        creator = CharacterCreator(self.screen_mock)
+        self.assertEqual(creator._active_preset_index, 3)  # Custom gray
+
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_2)
+        creator.handle_event(event)
+        self.assertEqual(creator._active_preset_index, 1)
+
+        event.key = pygame.K_RIGHT
+        creator.handle_event(event)
+        self.assertEqual(creator._active_preset_index, -1)
+
+        event.key = pygame.K_LEFT  # Back onto the Mage color
+        creator.handle_event(event)
+        self.assertEqual(creator._active_preset_index, 1)
+
+        # A plain list assigned by a caller still matches its preset
+        creator.body_color = [50, 200, 95]
+        creator.handle_event(SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_UP))  # Select Blue slider
+        creator.handle_event(SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_RIGHT))
+        self.assertEqual(creator._active_preset_index, 2)
+
+    def test_slider_value_text_rendered_once(self):
+        """Test slider value text is rendered on first use and then reused."""
+        creator = CharacterCreator(self.screen_mock)
+        render = creator.small_font.render
+        render.reset_mock()
+
+        first = creator._render_value(42)
+        self.assertIs(creator._render_value(42), first)
+        render.assert_called_once_with("42", True, (255, 255, 255))
+
+    def test_reset_restores_defaults_and_keeps_assets(self):
+        """Test reopening the creator starts fresh without re-rendering assets."""
+        creator = CharacterCreator(self.screen_mock)
+        preview_cache = creator._preview_cache
+        creator.body_color[0] = 10
+        creator.selected_eye_color_index = 2
+        creator.eye_color = creator.EYE_COLORS[2][1]
+        creator.active_slider = 1
+        creator._dirty_rects = []
+
+        creator.reset()
+
+        self.assertEqual(creator.body_color, [128, 128, 128])
+        self.assertEqual(creator.eye_color, creator.EYE_COLORS[0][1])
+        self.assertEqual(creator.active_slider, 0)
+        self.assertEqual(creator._active_preset_index, 3)
+        self.assertIs(creator._preview_cache, preview_cache)
+        self.assertEqual(len(creator._dirty_rects), 1)  # Full repaint
+        creator.small_font.render.assert_called_with(f"Name: {creator.name}", True, (255, 255, 255))
+
+    def test_state_change_marks_screen_dirty(self):
+        """Test visible state changes request a repaint of their region only."""
+        creator = CharacterCreator(self.screen_mock)
+        self.assertEqual(len(creator._dirty_rects), 1)  # First frame paints everything
+        creator._dirty_rects = []
+
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_DOWN)
+        creator.handle_event(event)
+        self.assertEqual(creator._dirty_rects, [creator._sliders_area])
+
+        creator.handle_event(event)  # Same region is only queued once
+        self.assertEqual(creator._dirty_rects, [creator._sliders_area])
+
+    def test_draw_repaints_each_dirty_region_clipped(self):
+        """Test draw() clips to each dirty region and returns them for display.update."""
+        creator = CharacterCreator(self.screen_mock)
+        creator.draw()
+        self.screen_mock.reset_mock()
+
+        event = SimpleNamespace(type=pygame.KEYDOWN, key=pygame.K_e)
+        creator.handle_event(event)
+        repainted = creator.draw()
+
+        self.assertEqual(repainted, [creator._preview_area, creator._eye_area])
+        clips = [c.args[0] for c in self.screen_mock.set_clip.call_args_list]
+        self.assertEqual(clips, [creator._preview_area, creator._eye_area, None])
+        self.assertEqual(creator.draw(), [])  # Nothing left to repaint
+
+    def test_mouse_motion_without_hover_change_is_not_dirty(self):
+        """Test mouse travel that doesn't change hover state skips repaint."""
+        creator = CharacterCreator(self.screen_mock)
+        creator.back_button_rect = Rect(690, 10, 100, 40)
+        creator.create_button_rect = Rect(610, 540, 180, 50)
+        creator._dirty_rects = []
+
+        event = SimpleNamespace(type=pygame.MOUSEMOTION, pos=(10, 10))
+        creator.handle_event(event)
+        self.assertEqual(creator._dirty_rects, [])
+
+        event.pos = (700, 20)  # Onto the back button
+        creator.handle_event(event)
+        self.assertTrue(creator.back_button_hovered)
+        self.assertEqual(creator._dirty_rects, [creator.back_button_rect])
+
+    def test_slider_click_before_first_draw(self):
+        """Test slider rects exist at init so early clicks are not dropped."""
+        creator = CharacterCreator(self.screen_mock)
+
+        self.assertEqual(len(creator.slider_rects), 3)
+
+        event = SimpleNamespace(
+            type=pygame.MOUSEBUTTONDOWN,
+            button=1,
+            pos=creator.slider_rects[1].center,
+        )
+        creator.handle_event(event)
+
+        self.assertEqual(creator.dragging_slider, 1)
+        self.assertEqual(creator.active_slider, 1)
+
+
+class TestCoalesceMouseMotion(unittest.TestCase):
+    """Test cases for per-frame mouse motion coalescing."""
+
+    def test_keeps_last_motion_of_each_run(self):
+        """Test consecutive motion collapses while button order is preserved."""
+        def make_event(event_type, pos=None):
+            event = SimpleNamespace(type=event_type, pos=pos)
+            return event
+
+        down = make_event(pygame.MOUSEBUTTONDOWN, (10, 10))
+        up = make_event(pygame.MOUSEBUTTONUP, (40, 10))
+        events = [
+            down,
+            make_event(pygame.MOUSEMOTION, (20, 10)),
+            make_event(pygame.MOUSEMOTION, (30, 10)),
+            make_event(pygame.MOUSEMOTION, (40, 10)),
+            up,
+        ]
+
+        coalesced = _coalesce_mouse_motion(events)
+
+        self.assertEqual(len(coalesced), 3)
+        self.assertIs(coalesced[0], down)
+        self.assertEqual(coalesced[1].pos, (40, 10))
+        self.assertIs(coalesced[2], up)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,237 +2,178 @@
 Tests for character selection functionality.
 """
 import pytest
-import pygame
-import sys
-import os
-from unittest.mock import Mock, MagicMock, patch
-
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from pygame import (
+    KEYDOWN, MOUSEBUTTONDOWN, MOUSEMOTION, SRCALPHA, K_LEFT, K_RETURN, K_RIGHT, K_SPACE, K_a,
+)
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 from character_selection import CharacterSelectionScreen
 from characters import CHARACTERS
 
+# Right twice, back past the first option to the last (custom) one, then
+# right to wrap to the start again
+_NAVIGATION_EVENTS = tuple(SimpleNamespace(type=KEYDOWN, key=key)
+                           for key in (K_RIGHT, K_RIGHT, K_LEFT, K_LEFT, K_LEFT, K_RIGHT))
+_NAVIGATION_INDICES = (1, 2, 1, 0, len(CHARACTERS), 0)
+
+
+@pytest.fixture
+def mock_surface(monkeypatch):
+    """Patch pygame.Surface so sprites are not really allocated."""
+    surface = Mock()
+    monkeypatch.setattr('character_selection.pygame.Surface', surface)
+    return surface
+
+
+@pytest.fixture
+def mock_draw_rect(monkeypatch):
+    """Patch pygame.draw.rect so the mock screen can be drawn on."""
+    draw_rect = Mock()
+    monkeypatch.setattr('character_selection.pygame.draw.rect', draw_rect)
+    return draw_rect
+
+
+@pytest.fixture
+def selection(screen):
+    """A fresh selection screen for each test."""
+    return CharacterSelectionScreen(screen)
+
+
+@pytest.fixture(scope="module")
+def _module_selection(screen):
+    """Build one selection screen for the module's key-handling tests."""
+    return CharacterSelectionScreen(screen)
+
+
+@pytest.fixture
+def key_selection(_module_selection):
+    """The shared selection screen, back on the first option.
+
+    Key handling only changes selected_index, so resetting that is enough
+    to give each test a clean screen.
+    """
+    _module_selection.reset_selection()
+    return _module_selection
+
 
 class TestCharacterSelectionScreen:
     """Test the character selection screen."""
 
-    def test_initialization(self):
+    def test_initialization(self, selection, screen):
         """Test that the selection screen initializes correctly."""
-        # Create a mock screen
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        # Mock pygame.font.Font at the module import location
-        with patch('character_selection.pygame.font.Font') as mock_font:
-            mock_font.return_value = Mock()
-            selection = CharacterSelectionScreen(screen)
-            assert selection.screen == screen
-            assert selection.selected_index == 0
-            assert selection.font is not None
-            assert selection.small_font is not None
-
-    def test_handle_event_right_key(self):
-        """Test handling right arrow key."""
-        screen = Mock()
-        with patch('character_selection.pygame.font.Font'):
-            selection = CharacterSelectionScreen(screen)
-
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_RIGHT
-            result = selection.handle_event(event)
-            assert result is None
-            assert selection.selected_index == 1
-
-    def test_handle_event_left_key(self):
-        """Test handling left arrow key."""
-        screen = Mock()
-        with patch('character_selection.pygame.font.Font'):
-            selection = CharacterSelectionScreen(screen)
-            selection.selected_index = 1
-
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_LEFT
-            result = selection.handle_event(event)
-            assert result is None
-            assert selection.selected_index == 0
-
-    def test_handle_event_wrap_around(self):
-        """Test that selection wraps around."""
-        screen = Mock()
-        with patch('character_selection.pygame.font.Font'):
-            selection = CharacterSelectionScreen(screen)
-
-            # Start at 0, press left should wrap to last option (custom character)
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_LEFT
-            selection.handle_event(event)
-            # Should wrap to last option (total_options - 1, which is 3 for 4 options)
-            assert selection.selected_index == selection.total_options - 1
-
-            # Press right to wrap back to 0
-            event.key = pygame.K_RIGHT
-            selection.handle_event(event)
-            assert selection.selected_index == 0
-
-    def test_handle_event_enter_confirms(self):
-        """Test that Enter key confirms selection."""
-        screen = Mock()
-        with patch('character_selection.pygame.font.Font'):
-            selection = CharacterSelectionScreen(screen)
-            selection.selected_index = 1
-
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_RETURN
-            result = selection.handle_event(event)
-            assert result == 1
-
-    def test_handle_event_space_confirms(self):
-        """Test that Space key confirms selection."""
-        screen = Mock()
-        with patch('character_selection.pygame.font.Font'):
-            selection = CharacterSelectionScreen(screen)
-            selection.selected_index = 2
-
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_SPACE
-            result = selection.handle_event(event)
-            assert result == 2
-
-    def test_handle_event_other_keys(self):
-        """Test that other keys don't affect selection."""
-        screen = Mock()
-        with patch('character_selection.pygame.font.Font'):
-            selection = CharacterSelectionScreen(screen)
-            initial_index = selection.selected_index
-
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_a
-            result = selection.handle_event(event)
-            assert result is None
-            assert selection.selected_index == initial_index
-
-    def test_mouse_hover_changes_selection(self):
-        """Test that hovering over a character changes selection."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('character_selection.pygame.font.Font'):
-            with patch('character_selection.pygame.Surface'):
-                with patch('character_selection.pygame.draw.rect'):
-                    selection = CharacterSelectionScreen(screen)
-                    # Draw to populate character_rects
-                    selection.draw()
-
-                    # Manually create proper rects for testing
-                    selection.character_rects = [
-                        pygame.Rect(0, 200, 200, 224),    # Character 0
-                        pygame.Rect(200, 200, 200, 224),  # Character 1
-                        pygame.Rect(400, 200, 200, 224),  # Character 2
-                        pygame.Rect(600, 200, 200, 224),  # Character 3 (custom)
-                    ]
-
-                    # Simulate hover over second character
-                    event = Mock()
-                    event.type = pygame.MOUSEMOTION
-                    event.pos = (300, 300)  # Inside second character rect
-
-                    selection.handle_event(event)
-                    assert selection.selected_index == 1
-
-    def test_mouse_click_confirms_selection(self):
-        """Test that clicking on an already selected character confirms it."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('character_selection.pygame.font.Font'):
-            with patch('character_selection.pygame.Surface'):
-                with patch('character_selection.pygame.draw.rect'):
-                    selection = CharacterSelectionScreen(screen)
-                    selection.selected_index = 0
-
-                    # Manually create proper rects for testing
-                    selection.character_rects = [
-                        pygame.Rect(0, 200, 200, 224),
-                        pygame.Rect(200, 200, 200, 224),
-                        pygame.Rect(400, 200, 200, 224),
-                        pygame.Rect(600, 200, 200, 224),
-                    ]
-
-                    # Simulate click on first character (already selected)
-                    event = Mock()
-                    event.type = pygame.MOUSEBUTTONDOWN
-                    event.button = 1
-                    event.pos = (100, 300)  # Inside first character rect
-
-                    result = selection.handle_event(event)
-                    assert result == 0
-
-    def test_mouse_click_selects_different_character(self):
-        """Test that clicking on a different character selects it."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('character_selection.pygame.font.Font'):
-            with patch('character_selection.pygame.Surface'):
-                with patch('character_selection.pygame.draw.rect'):
-                    selection = CharacterSelectionScreen(screen)
-                    selection.selected_index = 0
-
-                    # Manually create proper rects for testing
-                    selection.character_rects = [
-                        pygame.Rect(0, 200, 200, 224),
-                        pygame.Rect(200, 200, 200, 224),
-                        pygame.Rect(400, 200, 200, 224),
-                        pygame.Rect(600, 200, 200, 224),
-                    ]
-
-                    # Simulate click on second character
-                    event = Mock()
-                    event.type = pygame.MOUSEBUTTONDOWN
-                    event.button = 1
-                    event.pos = (300, 300)  # Inside second character rect
-
-                    result = selection.handle_event(event)
-                    # First click selects, doesn't confirm
-                    assert result is None
-                    assert selection.selected_index == 1
-
-    def test_mouse_click_outside_does_nothing(self):
-        """Test that clicking outside character areas does nothing."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('character_selection.pygame.font.Font'):
-            with patch('character_selection.pygame.Surface'):
-                with patch('character_selection.pygame.draw.rect'):
-                    selection = CharacterSelectionScreen(screen)
-                    selection.selected_index = 0
-
-                    # Manually create proper rects for testing
-                    selection.character_rects = [
-                        pygame.Rect(0, 200, 200, 224),
-                        pygame.Rect(200, 200, 200, 224),
-                        pygame.Rect(400, 200, 200, 224),
-                        pygame.Rect(600, 200, 200, 224),
-                    ]
-
-                    event = Mock()
-                    event.type = pygame.MOUSEBUTTONDOWN
-                    event.button = 1
-                    event.pos = (50, 50)  # Top area, outside all character rects
-
-                    result = selection.handle_event(event)
-                    assert result is None
-                    assert selection.selected_index == 0  # Should remain unchanged
+        assert selection.screen is screen
+        assert selection.selected_index == 0
+        assert selection.font is not None
+        assert selection.small_font is not None
+
+    @pytest.mark.parametrize("key,start_idx,expected_idx,expected_result", [
+        (K_RETURN, 1, 1, 1),     # Enter confirms the selection
+        (K_SPACE, 2, 2, 2),      # Space confirms the selection
+        (K_a, 0, 0, None),       # Other keys are ignored
+    ])
+    def test_handle_event_keys(self, key_selection, key, start_idx, expected_idx, expected_result):
+        """Test that Enter/Space confirm the selection and other keys are ignored."""
+        key_selection.selected_index = start_idx
+
+        event = SimpleNamespace(type=KEYDOWN, key=key)
+        result = key_selection.handle_event(event)
+        assert result == expected_result
+        assert key_selection.selected_index == expected_idx
+
+    def test_key_navigation(self, key_selection):
+        """Test that arrow keys move the selection and wrap around both ends."""
+        key_selection.selected_index = 0
+        for event, expected in zip(_NAVIGATION_EVENTS, _NAVIGATION_INDICES):
+            assert key_selection.handle_event(event) is None
+            assert key_selection.selected_index == expected
+
+    @pytest.mark.parametrize("etype,button,pos,init_idx,expected_res,expected_idx", [
+        (MOUSEMOTION, None, (300, 300), 0, None, 1),      # Hover selects the second character
+        (MOUSEBUTTONDOWN, 1, (100, 300), 0, 0, 0),        # Click on the selected one confirms
+        (MOUSEBUTTONDOWN, 1, (300, 300), 0, None, 1),     # First click elsewhere only selects
+        (MOUSEBUTTONDOWN, 1, (50, 50), 0, None, 0),       # Top area is outside all characters
+    ])
+    def test_mouse_events(self, selection, etype, button, pos, init_idx, expected_res, expected_idx):
+        """Test mouse hover and clicks over the character columns."""
+        selection.selected_index = init_idx
+
+        # Draw to lay out the clickable columns
+        selection.draw()
+
+        event = SimpleNamespace(type=etype, button=button, pos=pos)
+        result = selection.handle_event(event)
+        assert result == expected_res
+        assert selection.selected_index == expected_idx
+
+    def test_draw_renders_static_content_once(self, mock_font, mock_screen, mock_surface,
+                                              mock_draw_rect):
+        """Test that sprites and text are built on the first draw only."""
+        selection = CharacterSelectionScreen(mock_screen)
+        selection.draw()
+        render_calls = mock_font.return_value.render.call_count
+        surface_calls = mock_surface.call_count
+        assert render_calls > 0
+
+        selection.draw()
+
+        assert mock_font.return_value.render.call_count == render_calls
+        assert mock_surface.call_count == surface_calls
+        assert len(selection._sprite_rects) == 4
+
+    def test_reset_selection(self, selection):
+        """Test that reopening the screen starts from the first option."""
+        selection.selected_index = 2
+
+        selection.reset_selection()
+        assert selection.selected_index == 0
+
+    def test_draw_repaints_only_changed_highlights(self, selection, screen):
+        """Test that redraws are skipped or limited to the changed highlights."""
+        assert selection.draw() == [screen.get_rect()]
+        assert selection.draw() == []  # Nothing changed
+
+        selection.selected_index = 2
+        dirty = selection.draw()
+        assert dirty == [selection._sprite_rects[0].inflate(20, 20),
+                         selection._sprite_rects[2].inflate(20, 20)]
+
+        selection.invalidate()
+        assert selection.draw() == [screen.get_rect()]
+
+    def test_custom_sprite_is_opaque(self, selection):
+        """Test that the cached "+" sprite carries no per-pixel alpha."""
+        selection.draw()
+
+        custom_rect = selection._sprite_rects[len(CHARACTERS)]
+        custom_sprite = next(surface for surface, rect in selection._static_blits
+                             if rect is custom_rect)
+        assert custom_sprite.get_flags() & SRCALPHA == 0
+
+    def test_hover_uses_screen_columns(self, selection):
+        """Test hover maps x to a column within the clickable band only."""
+        event = SimpleNamespace(type=MOUSEMOTION, pos=(650, 300))
+        selection.handle_event(event)
+        assert selection.selected_index == 0  # Not laid out yet
+
+        selection.draw()
+        selection.handle_event(event)
+        assert selection.selected_index == 3
+
+        event.pos = (250, 100)  # Above the band
+        selection.handle_event(event)
+        assert selection.selected_index == 3
+
+    def test_update_hover_only_on_pointer_movement(self, selection):
+        """Test polled hover ignores a resting pointer so keys keep control."""
+        selection.draw()
+
+        selection.update_hover((650, 300))  # Baseline only
+        assert selection.selected_index == 0
+
+        selection.update_hover((250, 300))
+        assert selection.selected_index == 1
+
+        selection.selected_index = 2  # Keyboard choice
+        selection.update_hover((250, 300))
+        assert selection.selected_index == 2
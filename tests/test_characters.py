@@ -2,13 +2,12 @@
 Tests for character functionality.
 """
 import pytest
-import sys
-import os
+from unittest.mock import Mock, patch
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from characters import Character, CHARACTERS, get_character_by_index, to_display_format
 
-from characters import Character, CHARACTERS, get_character_by_index
+_CHAR_NAMES = frozenset(char.name for char in CHARACTERS)
+_CHAR_ATTRS = [(char.name, char.color, char.description) for char in CHARACTERS]
 
 
 class TestCharacter:
@@ -25,47 +24,33 @@ class TestCharacter:
         assert char.speed == 5
         assert char.size == 32
 
-    def test_character_move_within_bounds(self):
-        """Test that character moves correctly within bounds."""
+    @pytest.mark.parametrize("dx,dy,expected_x,expected_y", [
+        (10, 0, 410, 300),
+        (0, 15, 400, 315),
+        (-1000, 0, 400, 300),  # Off the left edge: step rejected
+        (0, -1000, 400, 300),  # Off the top edge: step rejected
+    ])
+    def test_character_move(self, dx, dy, expected_x, expected_y):
+        """Test that character moves by the step and stays within bounds."""
         char = Character("TestChar", (255, 0, 0), "Test")
-        original_x = char.x
-        original_y = char.y
-
-        char.move(10, 0, 800, 600)
-        assert char.x == original_x + 10
-        assert char.y == original_y
-
-        char.move(0, 15, 800, 600)
-        assert char.x == original_x + 10
-        assert char.y == original_y + 15
-
-    def test_character_move_boundary_x(self):
-        """Test that character respects x boundaries."""
-        char = Character("TestChar", (255, 0, 0), "Test")
-        char.x = 0
-
-        # Try to move beyond left boundary
-        char.move(-10, 0, 800, 600)
-        assert char.x == 0
-
-        # Move to right boundary
-        char.x = 768  # 800 - 32 (size)
-        char.move(10, 0, 800, 600)
-        assert char.x == 768
-
-    def test_character_move_boundary_y(self):
-        """Test that character respects y boundaries."""
+        char.move(dx, dy, 800, 600)
+        assert (char.x, char.y) == (expected_x, expected_y)
+
+    @pytest.mark.parametrize("start,step,expected", [
+        ((0, 300), (-10, 0), (0, 300)),        # Beyond the left boundary
+        ((768, 300), (10, 0), (768, 300)),     # Beyond the right boundary (800 - 32)
+        ((400, 0), (0, -10), (400, 0)),        # Beyond the top boundary
+        ((400, 568), (0, 10), (400, 568)),     # Beyond the bottom boundary (600 - 32)
+        ((3, 565), (-5, 5), (3, 565)),         # A step past the edge is dropped
+        ((3, 300), (-5, 5), (3, 305)),         # Each axis is checked on its own
+        ((5, 563), (-5, 5), (0, 568)),         # Landing exactly on the edge is allowed
+    ])
+    def test_character_move_boundaries(self, start, step, expected):
+        """Test that moves past the screen edges are rejected per axis."""
         char = Character("TestChar", (255, 0, 0), "Test")
-        char.y = 0
-
-        # Try to move beyond top boundary
-        char.move(0, -10, 800, 600)
-        assert char.y == 0
-
-        # Move to bottom boundary
-        char.y = 568  # 600 - 32 (size)
-        char.move(0, 10, 800, 600)
-        assert char.y == 568
+        char.x, char.y = start
+        char.move(*step, 800, 600)
+        assert (char.x, char.y) == expected
 
 
 class TestCharacterData:
@@ -73,25 +58,19 @@ class TestCharacterData:
 
     def test_characters_count(self):
         """Test that there are exactly 3 characters."""
-        assert len(CHARACTERS) == 3
+        assert len(_CHAR_ATTRS) == 3
 
     def test_characters_have_required_attributes(self):
         """Test that all characters have required attributes."""
-        for char in CHARACTERS:
-            assert hasattr(char, 'name')
-            assert hasattr(char, 'color')
-            assert hasattr(char, 'description')
-            assert isinstance(char.name, str)
-            assert isinstance(char.color, tuple)
-            assert len(char.color) == 3
-            assert isinstance(char.description, str)
+        for name, color, description in _CHAR_ATTRS:
+            assert isinstance(name, str)
+            assert isinstance(color, tuple)
+            assert len(color) == 3
+            assert isinstance(description, str)
 
     def test_character_names(self):
         """Test that characters have expected names."""
-        names = [char.name for char in CHARACTERS]
-        assert "Knight" in names
-        assert "Mage" in names
-        assert "Ranger" in names
+        assert {"Knight", "Mage", "Ranger"} <= _CHAR_NAMES
 
     def test_get_character_by_valid_index(self):
         """Test getting characters by valid index."""
@@ -112,3 +91,22 @@ class TestCharacterData:
         assert get_character_by_index(-1) is None
         assert get_character_by_index(3) is None
         assert get_character_by_index(100) is None
+
+
+class TestToDisplayFormat:
+    """Test converting surfaces to the display pixel format."""
+
+    def test_without_display_returns_surface_unchanged(self):
+        """Test conversion is skipped when no display mode is set."""
+        surface = Mock()
+        with patch('characters.pygame.display.get_surface', return_value=None):
+            assert to_display_format(surface) is surface
+        surface.convert.assert_not_called()
+        surface.convert_alpha.assert_not_called()
+
+    def test_with_display_converts(self):
+        """Test opaque and alpha surfaces use the matching conversion."""
+        surface = Mock()
+        with patch('characters.pygame.display.get_surface', return_value=Mock()):
+            assert to_display_format(surface) is surface.convert.return_value
+            assert to_display_format(surface, alpha=True) is surface.convert_alpha.return_value
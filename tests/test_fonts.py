@@ -0,0 +1,20 @@
+"""
+Tests for the shared font cache.
+"""
+from unittest.mock import patch
+
+from fonts import get_font
+
+
+class TestGetFont:
+    """Test the font cache."""
+
+    def test_font_created_once_per_size(self):
+        """Test that each size opens one font that is then reused."""
+        # The autouse isolated_font_cache fixture starts each test with an empty cache
+        with patch('fonts.pygame.font.Font') as mock_font:
+            mock_font.side_effect = lambda name, size: (name, size)
+
+            assert get_font(24) is get_font(24)
+            assert get_font(36) == (None, 36)
+            assert mock_font.call_count == 2
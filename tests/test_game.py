@@ -2,426 +2,283 @@
 Tests for game logic.
 """
 import pytest
-import pygame
-import sys
-import os
+from collections import defaultdict
+from pygame import (
+    KEYDOWN, MOUSEBUTTONDOWN, MOUSEMOTION, K_DOWN, K_ESCAPE, K_LEFT, K_RIGHT, K_UP, K_a, K_b,
+    K_d, K_s, K_w,
+)
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from game import Game
 
 
-class KeySequence:
-    """Mock sequence for pygame key states that supports large key indices."""
-
-    def __init__(self):
-        self._keys = {}
-
-    def __getitem__(self, key):
-        return self._keys.get(key, False)
-
-    def __setitem__(self, key, value):
-        self._keys[key] = value
-
-
-class TestGame:
-    """Test the Game class."""
-
-    def test_initialization(self):
-        """Test that the game initializes correctly."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)  # Knight
-            assert game.screen == screen
-            assert game.character is not None
-            assert game.character.name == "Knight"
-            assert game.sprite is not None
-            assert game.running is True
-
-    def test_initialization_different_characters(self):
-        """Test initialization with different characters."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game1 = Game(screen, 1)  # Mage
-            assert game1.character.name == "Mage"
-
-            game2 = Game(screen, 2)  # Ranger
-            assert game2.character.name == "Ranger"
-
-    def test_handle_event_escape(self):
-        """Test that ESC key stops the game."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            assert game.running is True
-
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_ESCAPE
-            game.handle_event(event)
-            assert game.running is False
-
-    def test_is_running(self):
-        """Test the is_running method."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            assert game.is_running() is True
-
-            game.running = False
-            assert game.is_running() is False
-
-    def test_update_movement_up(self):
-        """Test that up movement works."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            initial_y = game.character.y
-
-            # Simulate pressing UP key
-            keys = KeySequence()
-            keys[pygame.K_UP] = True
-            game.update(keys)
-
-            assert game.character.y < initial_y
-
-    def test_update_movement_down(self):
-        """Test that down movement works."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            initial_y = game.character.y
-
-            # Simulate pressing DOWN key
-            keys = KeySequence()
-            keys[pygame.K_DOWN] = True
-            game.update(keys)
-
-            assert game.character.y > initial_y
-
-    def test_update_movement_left(self):
-        """Test that left movement works."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            initial_x = game.character.x
-
-            # Simulate pressing LEFT key
-            keys = KeySequence()
-            keys[pygame.K_LEFT] = True
-            game.update(keys)
+# Stand-in for pygame's key state: pygame 2 arrow keycodes are above 2**30,
+# so a dict is used instead of a sequence, and defaultdict(bool) answers
+# unpressed keys in C
+_KEYS = defaultdict(bool)
 
-            assert game.character.x < initial_x
-
-    def test_update_movement_right(self):
-        """Test that right movement works."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            initial_x = game.character.x
-
-            # Simulate pressing RIGHT key
-            keys = KeySequence()
-            keys[pygame.K_RIGHT] = True
-            game.update(keys)
 
-            assert game.character.x > initial_x
+@pytest.fixture
+def keys():
+    """The shared key state with nothing pressed."""
+    _KEYS.clear()
+    return _KEYS
 
-    def test_update_movement_wasd(self):
-        """Test that WASD keys work for movement."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
 
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            initial_x = game.character.x
-            initial_y = game.character.y
+# Per-test state restored on the shared Game before each test
+_GAME_STATE = ('running', 'return_to_selection', 'target_pos', 'target_marker_timer',
+               'back_button_hovered')
+_CHARACTER_STATE = ('x', 'y', 'speed')
 
-            # Test W key (up)
-            keys = KeySequence()
-            keys[pygame.K_w] = True
-            game.update(keys)
-            assert game.character.y < initial_y
 
-            # Reset position
-            game.character.y = initial_y
+@pytest.fixture(scope="module")
+def _module_game(screen):
+    """Build one Game for the module and record its starting state."""
+    game = Game(screen, 0)
+    initial = ({name: getattr(game, name) for name in _GAME_STATE},
+               {name: getattr(game.character, name) for name in _CHARACTER_STATE})
+    return game, initial
 
-            # Test A key (left)
-            keys = KeySequence()
-            keys[pygame.K_a] = True
-            game.update(keys)
-            assert game.character.x < initial_x
 
-    def test_update_no_movement(self):
-        """Test that no keys pressed means no movement."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
+@pytest.fixture
+def game(_module_game):
+    """The shared Game, reset to its starting state.
 
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            initial_x = game.character.x
-            initial_y = game.character.y
+    Tests that count rendering work or need another character construct
+    their own Game instead, since cached surfaces are not reset.
+    """
+    game, (game_state, character_state) = _module_game
+    for name, value in game_state.items():
+        setattr(game, name, value)
+    for name, value in character_state.items():
+        setattr(game.character, name, value)
+    return game
 
-            keys = KeySequence()
-            game.update(keys)
 
-            assert game.character.x == initial_x
-            assert game.character.y == initial_y
+class TestGame:
+    """Test the Game class."""
 
-    def test_mouse_click_sets_target(self):
+    def test_initialization(self, mock_screen):
+        """Test that the game initializes correctly."""
+        game = Game(mock_screen, 0)  # Knight
+        assert game.screen == mock_screen
+        assert game.character is not None
+        assert game.character.name == "Knight"
+        assert game.sprite is not None
+        assert game.running is True
+
+    def test_initialization_different_characters(self, mock_screen):
+        """Test initialization with different characters."""
+        game1 = Game(mock_screen, 1)  # Mage
+        assert game1.character.name == "Mage"
+
+        game2 = Game(mock_screen, 2)  # Ranger
+        assert game2.character.name == "Ranger"
+
+    @pytest.mark.parametrize("key,running,return_to_selection", [
+        (None, True, False),       # No event: defaults
+        (K_ESCAPE, False, False),  # ESC quits the game
+        (K_b, False, True),        # B quits back to character selection
+    ], ids=["defaults", "escape", "b_key"])
+    def test_running_state(self, game, key, running, return_to_selection):
+        """Test the running and return-to-selection flags after a key press."""
+        if key is not None:
+            game.handle_event(SimpleNamespace(type=KEYDOWN, key=key))
+
+        assert game.running is running
+        assert game.return_to_selection is return_to_selection
+
+    def test_is_running(self, game):
+        """Test the is_running method."""
+        assert game.is_running() is True
+
+        game.running = False
+        assert game.is_running() is False
+
+    @pytest.mark.parametrize("key,axis,sign", [
+        (K_UP, 'y', -1),
+        (K_DOWN, 'y', 1),
+        (K_LEFT, 'x', -1),
+        (K_RIGHT, 'x', 1),
+        (K_w, 'y', -1),
+        (K_s, 'y', 1),
+        (K_a, 'x', -1),
+        (K_d, 'x', 1),
+        (None, None, 0),  # No keys pressed means no movement
+    ])
+    def test_update_movement(self, game, keys, key, axis, sign):
+        """Test that arrow keys and WASD move the character one step."""
+        game.character.x, game.character.y = 400, 300
+
+        if key is not None:
+            keys[key] = True
+        game.update(keys)
+
+        expected = {'x': 400, 'y': 300}
+        if axis is not None:
+            expected[axis] += sign * game.character.speed
+        assert (game.character.x, game.character.y) == (expected['x'], expected['y'])
+
+    def test_mouse_click_sets_target(self, game):
         """Test that mouse click sets target position."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
+        # Simulate mouse click
+        event = SimpleNamespace(type=MOUSEBUTTONDOWN, button=1, pos=(500, 300))
 
-            # Simulate mouse click
-            event = Mock()
-            event.type = pygame.MOUSEBUTTONDOWN
-            event.button = 1
-            event.pos = (500, 300)
+        game.handle_event(event)
 
-            game.handle_event(event)
+        assert game.target_pos == (500, 300)
+        assert game.target_marker_timer == 60
 
-            assert game.target_pos == (500, 300)
-            assert game.target_marker_timer == 60
-
-    def test_click_to_move_moves_character(self):
+    def test_click_to_move_moves_character(self, game, keys):
         """Test that character moves toward clicked position."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            game.character.x = 100
-            game.character.y = 100
+        game.character.x = 100
+        game.character.y = 100
 
-            # Set target to the right
-            game.target_pos = (200, 100)
+        # Set target to the right
+        game.target_pos = (200, 100)
 
-            keys = KeySequence()
-            game.update(keys)
+        game.update(keys)
 
-            # Character should have moved toward target
-            assert game.character.x > 100
+        # Character should have moved toward target
+        assert game.character.x > 100
 
-    def test_keyboard_cancels_click_to_move(self):
+    def test_keyboard_cancels_click_to_move(self, game, keys):
         """Test that keyboard input cancels click-to-move."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
+        # Set a target
+        game.target_pos = (500, 300)
 
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
+        # Press a key
+        keys[K_UP] = True
+        game.update(keys)
 
-            # Set a target
-            game.target_pos = (500, 300)
-
-            # Press a key
-            keys = KeySequence()
-            keys[pygame.K_UP] = True
-            game.update(keys)
+        # Target should be cancelled
+        assert game.target_pos is None
 
-            # Target should be cancelled
-            assert game.target_pos is None
-
-    def test_character_stops_at_target(self):
+    def test_character_stops_at_target(self, game, keys):
         """Test that character stops when reaching target."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-            game.character.x = 100
-            game.character.y = 100
-            game.character.speed = 5
-
-            # Set target to character's center (character center is at x + size/2, y + size/2)
-            char_center_x = game.character.x + game.character.size // 2
-            char_center_y = game.character.y + game.character.size // 2
-            game.target_pos = (char_center_x + 2, char_center_y + 2)
-
-            keys = KeySequence()
-            game.update(keys)
-
-            # Character should have reached target and stopped (distance < speed)
-            assert game.target_pos is None
-
-    def test_target_marker_timer_decrements(self):
-        """Test that target marker timer decrements each update."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-
-            game.target_marker_timer = 60
-
-            keys = KeySequence()
-            game.update(keys)
-
-            assert game.target_marker_timer == 59
-
-    def test_return_to_selection_flag_defaults_false(self):
-        """Test that return_to_selection flag is False by default."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
+        game.character.x = 100
+        game.character.y = 100
+        game.character.speed = 5
 
-            assert game.return_to_selection is False
+        # Set target to character's center (character center is at x + size/2, y + size/2)
+        char_center_x = game.character.x + game.character.size // 2
+        char_center_y = game.character.y + game.character.size // 2
+        game.target_pos = (char_center_x + 2, char_center_y + 2)
 
-    def test_b_key_sets_return_to_selection(self):
-        """Test that pressing B sets return_to_selection and stops game."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
+        game.update(keys)
 
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
+        # Character should have reached target and stopped (distance < speed)
+        assert game.target_pos is None
 
-            # Simulate pressing B key
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_b
-
-            game.handle_event(event)
-
-            assert game.return_to_selection is True
-            assert game.running is False
-
-    def test_escape_does_not_set_return_to_selection(self):
-        """Test that ESC stops game but doesn't set return_to_selection."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-
-            # Simulate pressing ESC key
-            event = Mock()
-            event.type = pygame.KEYDOWN
-            event.key = pygame.K_ESCAPE
+    def test_target_marker_timer_decrements(self, game, keys):
+        """Test that target marker timer decrements each update."""
+        game.target_marker_timer = 60
 
-            game.handle_event(event)
+        game.update(keys)
 
-            assert game.return_to_selection is False
-            assert game.running is False
+        assert game.target_marker_timer == 59
 
-    def test_back_button_hover(self):
+    def test_back_button_hover(self, game):
         """Test that hovering over back button sets hover state."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
+        # Initially not hovered
+        assert game.back_button_hovered is False
 
-            # Initially not hovered
-            assert game.back_button_hovered is False
+        # Simulate mouse motion over the button
+        event = SimpleNamespace(type=MOUSEMOTION, pos=game.back_button_rect.center)
 
-            # Simulate mouse motion over the button
-            event = Mock()
-            event.type = pygame.MOUSEMOTION
-            event.pos = (game.back_button_rect.centerx, game.back_button_rect.centery)
+        game.handle_event(event)
 
-            game.handle_event(event)
+        assert game.back_button_hovered is True
 
-            assert game.back_button_hovered is True
-
-    def test_back_button_not_hovered(self):
+    def test_back_button_not_hovered(self, game):
         """Test that moving mouse away from back button clears hover state."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
+        # Set hover state to True first
+        game.back_button_hovered = True
 
-            # Set hover state to True first
-            game.back_button_hovered = True
+        # Simulate mouse motion away from the button
+        # Far from the button in the top-right corner
+        event = SimpleNamespace(type=MOUSEMOTION, pos=(10, 10))
 
-            # Simulate mouse motion away from the button
-            event = Mock()
-            event.type = pygame.MOUSEMOTION
-            event.pos = (10, 10)  # Far from button in top-right
+        game.handle_event(event)
 
-            game.handle_event(event)
+        assert game.back_button_hovered is False
 
-            assert game.back_button_hovered is False
-
-    def test_back_button_click(self):
+    def test_back_button_click(self, game):
         """Test that clicking the back button returns to selection."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-
-            # Click the back button
-            event = Mock()
-            event.type = pygame.MOUSEBUTTONDOWN
-            event.button = 1  # Left click
-            event.pos = (game.back_button_rect.centerx, game.back_button_rect.centery)
+        # Left-click the back button
+        event = SimpleNamespace(type=MOUSEBUTTONDOWN, button=1, pos=game.back_button_rect.center)
 
-            game.handle_event(event)
+        game.handle_event(event)
 
-            assert game.return_to_selection is True
-            assert game.running is False
+        assert game.return_to_selection is True
+        assert game.running is False
 
-    def test_back_button_click_outside_does_not_return(self):
+    def test_back_button_click_outside_does_not_return(self, game):
         """Test that clicking outside the back button doesn't return to selection."""
-        screen = Mock()
-        screen.get_width = Mock(return_value=800)
-        screen.get_height = Mock(return_value=600)
-
-        with patch('game.pygame.font.Font'):
-            game = Game(screen, 0)
-
-            # Click somewhere else (not the back button)
-            event = Mock()
-            event.type = pygame.MOUSEBUTTONDOWN
-            event.button = 1  # Left click
-            event.pos = (400, 300)  # Center of screen, away from button
-
-            game.handle_event(event)
+        # Left-click the center of the screen, away from the back button
+        event = SimpleNamespace(type=MOUSEBUTTONDOWN, button=1, pos=(400, 300))
+
+        game.handle_event(event)
+
+        # Should not return to selection, just set target position
+        assert game.return_to_selection is False
+        assert game.running is True
+        assert game.target_pos == (400, 300)
+
+    def test_draw_blits_prerendered_background(self, mock_screen):
+        """Test that the grass pattern is rendered once, not every frame."""
+        with patch('game.pygame.Surface'), \
+             patch('game.pygame.draw.rect') as mock_rect:
+            game = Game(mock_screen, 0)
+            assert mock_rect.call_count == 20 * 15 + 4  # Grass tiles once, plus sprite eyes
+            mock_rect.reset_mock()
+
+            game.draw()
+
+            mock_screen.blit.assert_any_call(game._background, (0, 0))
+            assert mock_rect.call_count == 2  # Only the back button
+
+    def test_hud_rendered_once(self, mock_screen, mock_font):
+        """Test that HUD and button text are rendered on the first draw only."""
+        with patch('game.pygame.Surface'), \
+             patch('game.pygame.draw.rect'):
+            game = Game(mock_screen, 0)
+            game.draw()
+            game.draw()
+
+            assert mock_font.return_value.render.call_count == 2  # "Back" and the HUD line
+            mock_screen.blit.assert_any_call(game._hud_text, (20, 15))
+
+    def test_target_marker_frames_rendered_once(self, mock_screen):
+        """Test that marker frames are pre-rendered once and picked by timer."""
+        with patch('game.pygame.draw.rect'):
+            game = Game(mock_screen, 0)
+            game._back_text = game._hud_text = game._hud_bg = Mock()  # Skip HUD text rendering
+            game.target_pos = (100, 100)
+            game.target_marker_timer = 60
+            game.draw()
+            frames = game._marker_frames
+            assert len(frames) == Game.MARKER_FRAMES
+
+            game.target_marker_timer = 30
+            game.draw()
+            assert game._marker_frames is frames
+            marker, (half_width, half_height) = frames[29]
+            assert marker.get_size() == (half_width * 2, half_height * 2)
+            mock_screen.blit.assert_any_call(marker, (100 - half_width, 100 - half_height))
+
+    def test_click_to_move_velocity_computed_once(self, game, keys):
+        """Test that the path to the target is normalized when it is set, not per update."""
+        game.character.x = 100
+        game.character.y = 100
+        game.target_pos = (216, 216)  # 100 right, 100 down of the center
+
+        with patch('game.math.hypot') as mock_hypot:
+            game.update(keys)
+            game.update(keys)
+            mock_hypot.assert_not_called()
 
-            # Should not return to selection, just set target position
-            assert game.return_to_selection is False
-            assert game.running is True
-            assert game.target_pos == (400, 300)
+        step = game.character.speed / 2 ** 0.5
+        assert game.character.x == pytest.approx(100 + 2 * step)
+        assert game.character.y == pytest.approx(100 + 2 * step)